@@ -4,11 +4,9 @@ QnA Support Application - Streamlit UI
 Main application interface for support query classification.
 """
 
+import time
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime
 
 from src.core.config import get_settings
 from src.core.models import QueryInput, SessionMetrics
@@ -21,6 +19,30 @@ from pydantic import ValidationError
 setup_logger()
 logger = get_logger()
 
+# Static sidebar content (built once per process, not per rerun)
+CATEGORIES = (
+    "Billing & Payments",
+    "Technical Issues",
+    "Account Management",
+    "Product Questions",
+    "Feature Requests",
+    "Bug Reports",
+    "General Inquiry",
+)
+
+SAMPLE_QUERIES = (
+    "I was charged twice for my subscription",
+    "The app crashes when I upload files",
+    "I forgot my password and can't log in",
+    "How do I export my data to CSV?",
+    "Please add dark mode to the app",
+    "The total amount shown is incorrect",
+)
+
+# Badge lookups for the results panel
+PRIORITY_EMOJI = {"critical": "🔴", "high": "🟡", "normal": "🟢", "low": "⚪"}
+METHOD_EMOJI = {"rule-based": "⚡", "llm-fallback": "🤖"}
+
 # Page configuration
 st.set_page_config(
     page_title="QnA Support Application",
@@ -29,15 +51,30 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize
-settings = get_settings()
-classifier = get_classifier()
-router = get_router()
+# Initialize (cached across reruns and sessions)
+@st.cache_resource
+def _cached_settings():
+    """Load application settings once per process."""
+    return get_settings()
 
-# Session state initialization
-if 'classifications' not in st.session_state:
-    st.session_state.classifications = []
 
+@st.cache_resource
+def _cached_classifier():
+    """Build the hybrid classifier once per process."""
+    return get_classifier()
+
+
+@st.cache_resource
+def _cached_router():
+    """Build the smart router once per process."""
+    return get_router()
+
+
+settings = _cached_settings()
+classifier = _cached_classifier()
+router = _cached_router()
+
+# Session state initialization
 if 'session_id' not in st.session_state:
     import uuid
     st.session_state.session_id = str(uuid.uuid4())
@@ -49,6 +86,158 @@ logger.info("Streamlit app initialized", session_id=st.session_state.session_id)
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Per-query fields kept for the history table / CSV export.
+# Stored column-wise (dict of lists) so the DataFrame is built without
+# re-parsing one dict per row.
+HISTORY_COLUMNS = (
+    'query_text',
+    'category',
+    'confidence',
+    'method',
+    'response_time_ms',
+    'llm_tokens_used',
+    'estimated_cost',
+    'routing_priority',
+    'reasoning',
+    'timestamp_epoch',
+)
+
+
+def _reset_history():
+    """Start an empty column-wise classification history."""
+    st.session_state.cols = {name: [] for name in HISTORY_COLUMNS}
+
+
+def _record_history(query_text: str, result):
+    """Append one classification to the column-wise history."""
+    cols = st.session_state.cols
+    cols['query_text'].append(query_text)
+    cols['category'].append(result.category.value)
+    cols['confidence'].append(result.confidence)
+    cols['method'].append(result.method.value)
+    cols['response_time_ms'].append(result.response_time_ms)
+    # Store 0 rather than None so these stay numeric columns (no NaN/fillna)
+    cols['llm_tokens_used'].append(result.llm_tokens_used or 0)
+    cols['estimated_cost'].append(result.estimated_cost or 0.0)
+    cols['routing_priority'].append(result.routing_priority.value)
+    cols['reasoning'].append(result.reasoning)
+    cols['timestamp_epoch'].append(time.time())  # formatted only on export
+
+
+@st.cache_data(max_entries=32)
+def _csv_bytes(session_id: str, n_rows: int, last_timestamp: float, _cols: dict) -> bytes:
+    """
+    Serialize the session history to CSV.
+    
+    Cached on (session, row count, last row timestamp) so the export is only
+    rebuilt when a new classification arrives; ``_cols`` is not hashed.
+    Epoch timestamps are rendered as local ISO-8601 strings here.
+    """
+    from datetime import datetime
+    
+    import pandas as pd
+    
+    df = pd.DataFrame(_cols, copy=False)
+    df = df.rename(columns={'timestamp_epoch': 'timestamp'})
+    df['timestamp'] = [datetime.fromtimestamp(t).isoformat() for t in _cols['timestamp_epoch']]
+    return df.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(max_entries=32)
+def _history_table(session_id: str, n_rows: int, last_timestamp: float, _cols: dict):
+    """
+    Build the formatted query-history table.
+    
+    Keyed like _csv_bytes, so the single per-render DataFrame is only
+    rebuilt when a classification is added. category/method repeat a
+    handful of labels, so they are stored as pandas categoricals.
+    """
+    import pandas as pd
+    
+    display_df = pd.DataFrame({
+        name: _cols[name]
+        for name in ('query_text', 'category', 'confidence', 'method', 'response_time_ms')
+    }).astype({'category': 'category', 'method': 'category'})
+    
+    display_df['confidence'] = display_df['confidence'].apply(lambda x: f"{x:.0%}")
+    display_df['response_time_ms'] = display_df['response_time_ms'].apply(lambda x: f"{x:.0f}ms")
+    return display_df.rename(columns={
+        'query_text': 'Query',
+        'category': 'Category',
+        'confidence': 'Confidence',
+        'method': 'Method',
+        'response_time_ms': 'Time'
+    })
+
+
+# Chart builders: cached so reruns that add no rows (expanders, tab
+# switches, downloads) reuse the figure instead of rebuilding traces.
+
+@st.cache_data(max_entries=32)
+def _category_pie(category_items: tuple):
+    """Pie chart of (category, count) pairs."""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(data=[go.Pie(
+        labels=[name for name, _ in category_items],
+        values=[count for _, count in category_items],
+        hole=0.3
+    )])
+    fig.update_layout(title="Queries by Category")
+    return fig
+
+
+@st.cache_data(max_entries=32)
+def _method_bar(method_items: tuple):
+    """Bar chart of (method, count) pairs."""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(data=[go.Bar(
+        x=[name for name, _ in method_items],
+        y=[count for _, count in method_items],
+        marker_color=['#1f77b4', '#ff7f0e']
+    )])
+    fig.update_layout(title="Classification Methods Used")
+    return fig
+
+
+@st.cache_data(max_entries=32)
+def _response_time_line(session_id: str, n_rows: int, last_timestamp: float, _values: list):
+    """Response time per query; keyed like _csv_bytes, ``_values`` not hashed."""
+    import plotly.express as px
+    
+    return px.line(
+        y=_values,
+        title='Response Time Over Queries',
+        labels={'index': 'Query Number', 'y': 'Response Time (ms)'}
+    )
+
+
+@st.cache_data(max_entries=32)
+def _confidence_histogram(session_id: str, n_rows: int, last_timestamp: float, _values: list):
+    """Confidence distribution; keyed like _csv_bytes, ``_values`` not hashed."""
+    import plotly.express as px
+    
+    return px.histogram(
+        x=_values,
+        nbins=20,
+        title='Confidence Score Distribution',
+        labels={'x': 'Confidence Score'}
+    )
+
+
+def _reset_metrics():
+    """Start fresh session metrics (updated incrementally per result)."""
+    st.session_state.session_metrics = SessionMetrics()
+
+
+if 'cols' not in st.session_state:
+    _reset_history()
+
+if 'session_metrics' not in st.session_state:
+    _reset_metrics()
+
+
 def classify_query(query_text: str, user_id: str = None):
     """Classify a query and store result."""
     try:
@@ -64,10 +253,8 @@ def classify_query(query_text: str, user_id: str = None):
             result = classifier.classify(query)
         
         # Store in session
-        result_dict = result.model_dump()
-        result_dict['query_text'] = query_text
-        result_dict['timestamp'] = datetime.now().isoformat()
-        st.session_state.classifications.append(result_dict)
+        _record_history(query_text, result)
+        st.session_state.session_metrics.record(result)
         
         logger.info(
             "Query classified via UI",
@@ -80,34 +267,18 @@ def classify_query(query_text: str, user_id: str = None):
         
     except ValidationError as e:
         st.error(f"❌ Invalid input: {e.errors()[0]['msg']}")
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error", error=str(e))
         return None
     
     except Exception as e:
         st.error(f"❌ Classification failed: {str(e)}")
-        logger.error(f"Classification error: {e}")
+        logger.error("Classification error", error=str(e))
         return None
 
 
 def calculate_session_metrics() -> SessionMetrics:
-    """Calculate metrics from session classifications."""
-    if not st.session_state.classifications:
-        return SessionMetrics()
-    
-    df = pd.DataFrame(st.session_state.classifications)
-    
-    metrics = SessionMetrics(
-        total_queries=len(df),
-        rule_based_count=len(df[df['method'] == 'rule-based']),
-        llm_fallback_count=len(df[df['method'] == 'llm-fallback']),
-        average_confidence=df['confidence'].mean(),
-        average_response_time_ms=df['response_time_ms'].mean(),
-        total_tokens_used=df['llm_tokens_used'].fillna(0).sum(),
-        estimated_total_cost=df['estimated_cost'].fillna(0).sum(),
-        category_distribution=df['category'].value_counts().to_dict()
-    )
-    
-    return metrics
+    """Return session metrics (kept current by SessionMetrics.record)."""
+    return st.session_state.session_metrics
 
 
 # ============================================================================
@@ -130,32 +301,14 @@ with st.sidebar:
     st.markdown("---")
     
     st.header("📚 Categories")
-    categories = [
-        "Billing & Payments",
-        "Technical Issues",
-        "Account Management",
-        "Product Questions",
-        "Feature Requests",
-        "Bug Reports",
-        "General Inquiry"
-    ]
-    for cat in categories:
+    for cat in CATEGORIES:
         st.markdown(f"• {cat}")
     
     st.markdown("---")
     
     st.header("🧪 Sample Queries")
-    sample_queries = [
-        "I was charged twice for my subscription",
-        "The app crashes when I upload files",
-        "I forgot my password and can't log in",
-        "How do I export my data to CSV?",
-        "Please add dark mode to the app",
-        "The total amount shown is incorrect"
-    ]
-    
-    for sample in sample_queries:
-        if st.button(sample, key=f"sample_{hash(sample)}", width="stretch"):
+    for i, sample in enumerate(SAMPLE_QUERIES):
+        if st.button(sample, key=f"sample_{i}", width="stretch"):
             st.session_state.current_query = sample
 
 # Main content
@@ -207,18 +360,18 @@ with col1:
 with col2:
     st.subheader("⚙️ System Status")
     
-    if st.session_state.classifications:
+    if st.session_state.cols['query_text']:
         metrics = calculate_session_metrics()
+        history = st.session_state.cols
         
         # Show last query info
-        last_query = st.session_state.classifications[-1]
-        st.info(f"**Last Query**: {last_query['query_text'][:50]}...")
+        st.info(f"**Last Query**: {history['query_text'][-1][:50]}...")
         
         col_s1, col_s2 = st.columns(2)
         with col_s1:
-            st.metric("Category", last_query['category'])
+            st.metric("Category", history['category'][-1])
         with col_s2:
-            confidence_pct = f"{last_query['confidence']:.0%}"
+            confidence_pct = f"{history['confidence'][-1]:.0%}"
             st.metric("Confidence", confidence_pct)
         
         st.markdown("---")
@@ -235,14 +388,14 @@ with col2:
 
 # Classification Logic
 if classify_btn:
-    logger.info(f"Classify button clicked | query_length={len(query_input) if query_input else 0}")
+    logger.info("Classify button clicked", query_length=len(query_input) if query_input else 0)
     
     if not query_input or not query_input.strip():
         st.warning("⚠️ Please enter a query to classify")
         logger.warning("Empty query submitted")
     elif len(query_input.strip()) < 5:
         st.warning("⚠️ Query must be at least 5 characters long")
-        logger.warning(f"Query too short: {len(query_input.strip())} chars")
+        logger.warning("Query too short", query_length=len(query_input.strip()))
     else:
         result = classify_query(query_input)
         
@@ -274,11 +427,11 @@ if classify_btn:
                 st.metric("**Confidence**", f"{confidence_color} {result.confidence:.0%}")
             
             with col_r3:
-                method_emoji = "⚡" if result.method.value == "rule-based" else "🤖"
+                method_emoji = METHOD_EMOJI.get(result.method.value, "🤖")
                 st.metric("**Method**", f"{method_emoji} {result.method.value.replace('-', ' ').title()}")
             
             with col_r4:
-                priority_emoji = {"critical": "🔴", "high": "🟡", "normal": "🟢", "low": "⚪"}.get(result.routing_priority, "🟢")
+                priority_emoji = PRIORITY_EMOJI.get(result.routing_priority, "🟢")
                 st.metric("**Priority**", f"{priority_emoji} {result.routing_priority.title()}")
             
             # Additional categories if multi-intent
@@ -308,6 +461,8 @@ if classify_btn:
             # Show all category scores in debug mode
             if result.category_scores:
                 with st.expander("🔍 All Category Scores (Debug)"):
+                    import pandas as pd
+                    
                     scores_df = pd.DataFrame([
                         {"Category": cat, "Confidence": f"{score:.2%}"}
                         for cat, score in sorted(
@@ -357,7 +512,8 @@ if clear_btn:
 
 if reset_btn:
     logger.info("Reset button clicked")
-    st.session_state.classifications = []
+    _reset_history()
+    _reset_metrics()
     if 'query_text_input' in st.session_state:
         del st.session_state['query_text_input']
     if 'current_query' in st.session_state:
@@ -365,12 +521,12 @@ if reset_btn:
     st.rerun()
 
 # Session Metrics Dashboard
-if st.session_state.classifications:
+if st.session_state.cols['query_text']:
+    # pandas/plotly are imported lazily inside the cached builders above
     st.markdown("---")
     st.subheader("📈 Session Analytics")
     
     metrics = calculate_session_metrics()
-    df = pd.DataFrame(st.session_state.classifications)
     
     # Summary metrics
     col_m1, col_m2, col_m3, col_m4, col_m5 = st.columns(5)
@@ -393,66 +549,43 @@ if st.session_state.classifications:
     # Charts
     tab1, tab2, tab3 = st.tabs(["📊 Category Distribution", "⏱️ Performance", "📋 Query History"])
     
+    history = st.session_state.cols
+    fingerprint = (
+        st.session_state.session_id,
+        len(history['query_text']),
+        history['timestamp_epoch'][-1]
+    )
+    
     with tab1:
         if metrics.category_distribution:
             # Category distribution pie chart
-            fig_cat = go.Figure(data=[go.Pie(
-                labels=list(metrics.category_distribution.keys()),
-                values=list(metrics.category_distribution.values()),
-                hole=0.3
-            )])
-            fig_cat.update_layout(title="Queries by Category")
-            st.plotly_chart(fig_cat, width="stretch")
+            st.plotly_chart(
+                _category_pie(tuple(metrics.category_distribution.most_common())),
+                width="stretch"
+            )
             
             # Method distribution
-            method_counts = df['method'].value_counts()
-            fig_method = go.Figure(data=[go.Bar(
-                x=method_counts.index,
-                y=method_counts.values,
-                marker_color=['#1f77b4', '#ff7f0e']
-            )])
-            fig_method.update_layout(title="Classification Methods Used")
-            st.plotly_chart(fig_method, width="stretch")
+            st.plotly_chart(
+                _method_bar(tuple(metrics.method_distribution.items())),
+                width="stretch"
+            )
     
     with tab2:
         # Response time over queries
-        fig_time = px.line(
-            df,
-            y='response_time_ms',
-            title='Response Time Over Queries',
-            labels={'index': 'Query Number', 'response_time_ms': 'Response Time (ms)'}
+        st.plotly_chart(
+            _response_time_line(*fingerprint, history['response_time_ms']),
+            width="stretch"
         )
-        st.plotly_chart(fig_time, width="stretch")
         
         # Confidence distribution
-        fig_conf = px.histogram(
-            df,
-            x='confidence',
-            nbins=20,
-            title='Confidence Score Distribution',
-            labels={'confidence': 'Confidence Score'}
+        st.plotly_chart(
+            _confidence_histogram(*fingerprint, history['confidence']),
+            width="stretch"
         )
-        st.plotly_chart(fig_conf, width="stretch")
     
     with tab3:
-        # Query history table
-        display_df = df[[
-            'query_text',
-            'category',
-            'confidence',
-            'method',
-            'response_time_ms'
-        ]].copy()
-        
-        display_df['confidence'] = display_df['confidence'].apply(lambda x: f"{x:.0%}")
-        display_df['response_time_ms'] = display_df['response_time_ms'].apply(lambda x: f"{x:.0f}ms")
-        display_df = display_df.rename(columns={
-            'query_text': 'Query',
-            'category': 'Category',
-            'confidence': 'Confidence',
-            'method': 'Method',
-            'response_time_ms': 'Time'
-        })
+        # Query history table (built once per new row, see _history_table)
+        display_df = _history_table(*fingerprint, history)
         
         st.dataframe(
             display_df,
@@ -461,7 +594,7 @@ if st.session_state.classifications:
         )
         
         # Download button
-        csv = df.to_csv(index=False)
+        csv = _csv_bytes(*fingerprint, history)
         st.download_button(
             label="📥 Download Session Data (CSV)",
             data=csv,
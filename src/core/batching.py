@@ -0,0 +1,154 @@
+"""
+Dynamic micro-batching for concurrent LLM calls.
+
+Concurrent submissions that arrive within a short window are grouped
+and handed to one async handler call (e.g. a single Chat Completions
+request covering several queries), then each caller gets its own
+result back.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, List, Tuple, TypeVar
+
+from src.utils.async_runner import get_event_loop
+from src.utils.logger import get_logger
+
+logger = get_logger()
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BatchQueue(Generic[T, R]):
+    """
+    Collects concurrent submissions into batches for one handler.
+
+    A batch is flushed when it reaches ``max_batch`` items or
+    ``max_wait_ms`` after its first item arrived, whichever is first.
+    Up to ``max_inflight`` batches run concurrently, so the next batch
+    is collected while earlier ones are still waiting on the handler.
+    All batching state lives on the shared background event loop, so
+    submit() may be awaited from any loop (or via run_sync from sync
+    code).
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[T]], Awaitable[List[R]]],
+        max_batch: int = 8,
+        max_wait_ms: float = 50,
+        max_inflight: int = 4
+    ):
+        """
+        Initialize queue.
+
+        Args:
+            handler: Async function mapping a list of items to a list of
+                results (same length and order)
+            max_batch: Maximum items per handler call
+            max_wait_ms: Maximum time the first item waits for company
+            max_inflight: Maximum concurrent handler calls
+        """
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.max_inflight = max_inflight
+
+        self._pending: List[Tuple[T, asyncio.Future]] = []
+        self._wakeup = None  # asyncio.Event, created on the batching loop
+        self._drainer = None  # Running drain task, if any
+        self._inflight = None  # asyncio.Semaphore bounding handler calls
+        self._running = set()  # Batch tasks (strong refs until done)
+
+    async def submit(self, item: T) -> R:
+        """
+        Queue one item and wait for its result.
+
+        Args:
+            item: Item to process
+
+        Returns:
+            The handler's result for this item
+        """
+        loop = get_event_loop()
+        if asyncio.get_running_loop() is loop:
+            return await self._enqueue(item)
+
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(self._enqueue(item), loop)
+        )
+
+    async def _enqueue(self, item: T) -> R:
+        """Add item to the pending batch (runs on the batching loop)."""
+        loop = asyncio.get_running_loop()
+
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+            self._inflight = asyncio.Semaphore(self.max_inflight)
+
+        future = loop.create_future()
+        self._pending.append((item, future))
+        self._wakeup.set()
+
+        if self._drainer is None:
+            self._drainer = loop.create_task(self._drain())
+
+        return await future
+
+    async def _drain(self) -> None:
+        """Form batches and start handler calls until nothing is pending."""
+        loop = asyncio.get_running_loop()
+
+        while self._pending:
+            # Give concurrent callers a short window to join the batch
+            deadline = loop.time() + self.max_wait
+            while len(self._pending) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+            # Wait for a free slot; items keep queueing meanwhile
+            await self._inflight.acquire()
+
+            batch = self._pending[:self.max_batch]
+            self._pending = self._pending[self.max_batch:]
+
+            # Run in the background so the next batch can be collected
+            task = loop.create_task(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._batch_done)
+
+        # Idle: exit (restarted by the next submission) so no task
+        # outlives the queue
+        self._drainer = None
+
+    def _batch_done(self, task: asyncio.Task) -> None:
+        """Release the in-flight slot of a finished batch."""
+        self._running.discard(task)
+        self._inflight.release()
+
+    async def _run(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        """Run the handler for one batch and resolve its futures."""
+        logger.debug("Flushing batch", batch_size=len(batch))
+
+        try:
+            results = await self.handler([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Batch handler returned {len(results)} results for {len(batch)} items"
+                )
+        except Exception as e:
+            logger.error("Batch handler failed", batch_size=len(batch), error=str(e))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():  # Caller may have been cancelled
+                future.set_result(result)
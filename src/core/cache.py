@@ -0,0 +1,257 @@
+"""
+In-process caches for LLM classification results.
+
+Two tiers, checked in order before any Azure call:
+- ResultCache: exact match on normalized query text (LRU + TTL)
+- SemanticCache: nearest cached query by embedding cosine similarity
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.core.models import ClassificationResult
+
+
+def normalize_cache_key(text: str) -> str:
+    """
+    Normalize query text for cache lookups.
+
+    Args:
+        text: Raw query text
+
+    Returns:
+        Lowercased text with whitespace collapsed to single spaces
+    """
+    return " ".join(text.lower().split())
+
+
+def _hash_key(text: str) -> bytes:
+    """Fixed-size digest of the normalized text (bounded key memory)."""
+    return hashlib.blake2b(normalize_cache_key(text).encode("utf-8"), digest_size=16).digest()
+
+
+class ResultCache:
+    """
+    Bounded LRU cache with per-entry time-to-live.
+
+    Thread-safe, since Streamlit sessions and the async batch loop may
+    share one classifier.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl_seconds: float = 3600):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries (0 disables caching)
+            ttl_seconds: Seconds before an entry expires
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[bytes, Tuple[float, ClassificationResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, query_text: str) -> Optional[ClassificationResult]:
+        """
+        Look up a cached result.
+
+        Args:
+            query_text: Raw query text
+
+        Returns:
+            Cached result, or None on miss / expiry
+        """
+        if self.maxsize <= 0:
+            return None
+
+        key = _hash_key(query_text)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, query_text: str, result: ClassificationResult) -> None:
+        """
+        Store a result, evicting the least recently used entry if full.
+
+        Args:
+            query_text: Raw query text
+            result: Result to cache
+        """
+        if self.maxsize <= 0:
+            return
+
+        key = _hash_key(query_text)
+        expires_at = time.monotonic() + self.ttl_seconds
+
+        with self._lock:
+            self._entries[key] = (expires_at, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache over query embeddings.
+
+    Embeddings are stored as unit rows of one float32 matrix, so a lookup
+    is a single matrix-vector product. Once the cache holds
+    ``pca_min_entries`` vectors it is projected onto its top
+    ``pca_dims`` principal directions (uncentered, so cosine similarity
+    is approximately preserved) to keep lookups cheap as it grows.
+    When full, the oldest entry is overwritten.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        threshold: float = 0.92,
+        pca_dims: int = 64,
+        pca_min_entries: int = 1000
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries (0 disables caching)
+            threshold: Minimum cosine similarity for a hit
+            pca_dims: Dimensions to project to once the cache is large
+            pca_min_entries: Entry count that triggers the projection
+        """
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.pca_dims = pca_dims
+        self.pca_min_entries = pca_min_entries
+
+        self._vectors: Optional[np.ndarray] = None  # (capacity, dim) buffer
+        self._results: List[ClassificationResult] = []
+        self._projection: Optional[np.ndarray] = None  # (raw_dim, pca_dims)
+        self._next = 0  # Ring-buffer write position once full
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _prepare(self, embedding) -> np.ndarray:
+        """Project (if fitted) and L2-normalize one embedding."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        if self._projection is not None:
+            vector = vector @ self._projection
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def get(self, embedding) -> Optional[ClassificationResult]:
+        """
+        Find the most similar cached query.
+
+        Args:
+            embedding: Query embedding (any sequence of floats)
+
+        Returns:
+            Cached result if similarity >= threshold, else None
+        """
+        with self._lock:
+            if not self._results:
+                self.misses += 1
+                return None
+
+            query = self._prepare(embedding)
+            similarities = self._vectors[:len(self._results)] @ query
+            best = int(np.argmax(similarities))
+
+            if similarities[best] < self.threshold:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return self._results[best]
+
+    def put(self, embedding, result: ClassificationResult) -> None:
+        """
+        Store a result under its query embedding.
+
+        Args:
+            embedding: Query embedding
+            result: Result to cache
+        """
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            vector = self._prepare(embedding)
+            count = len(self._results)
+
+            if count < self.maxsize:
+                if self._vectors is None:
+                    self._vectors = np.empty((min(64, self.maxsize), vector.shape[0]), dtype=np.float32)
+                elif count == self._vectors.shape[0]:
+                    # Grow by doubling (amortized O(1) appends)
+                    grown = np.empty((min(count * 2, self.maxsize), self._vectors.shape[1]), dtype=np.float32)
+                    grown[:count] = self._vectors
+                    self._vectors = grown
+                self._vectors[count] = vector
+                self._results.append(result)
+
+                if (
+                    self._projection is None
+                    and count + 1 >= self.pca_min_entries
+                    and vector.shape[0] > self.pca_dims
+                ):
+                    self._fit_projection()
+            else:
+                self._vectors[self._next] = vector
+                self._results[self._next] = result
+                self._next = (self._next + 1) % self.maxsize
+
+    def _fit_projection(self) -> None:
+        """Project stored vectors onto their top principal directions."""
+        count = len(self._results)
+        stored = self._vectors[:count]
+
+        # Right singular vectors of the uncentered matrix: the subspace
+        # that best preserves dot products between stored embeddings.
+        _, _, vt = np.linalg.svd(stored, full_matrices=False)
+        self._projection = np.ascontiguousarray(vt[:self.pca_dims].T)
+
+        projected = stored @ self._projection
+        norms = np.linalg.norm(projected, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+
+        vectors = np.empty((self._vectors.shape[0], self.pca_dims), dtype=np.float32)
+        vectors[:count] = projected / norms
+        self._vectors = vectors
+
+    def clear(self) -> None:
+        """Remove all entries (and any fitted projection)."""
+        with self._lock:
+            self._vectors = None
+            self._results = []
+            self._projection = None
+            self._next = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
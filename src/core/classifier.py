@@ -6,7 +6,9 @@ Combines rule-based and LLM classifiers in a hybrid approach:
 2. If confidence < threshold, escalate to LLM
 """
 
+import asyncio
 import time
+from functools import lru_cache
 from typing import Optional
 
 from src.core.config import get_settings
@@ -17,7 +19,8 @@ from src.core.models import (
 )
 from src.core.rule_classifier import get_rule_classifier
 from src.core.llm_classifier import get_llm_classifier
-from src.utils.logger import get_logger
+from src.utils.async_runner import run_sync
+from src.utils.logger import get_logger, is_log_enabled
 
 logger = get_logger()
 
@@ -39,6 +42,10 @@ class HybridClassifier:
         self.rule_classifier = get_rule_classifier()
         self.llm_classifier = get_llm_classifier()
         
+        # Checked once: loguru builds the kwargs even for dropped messages
+        self._debug_enabled = is_log_enabled("DEBUG")
+        self._info_enabled = is_log_enabled("INFO")
+        
         logger.info(
             "HybridClassifier initialized",
             confidence_threshold=self.settings.confidence_threshold
@@ -54,109 +61,251 @@ class HybridClassifier:
         Returns:
             ClassificationResult from best classifier
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        logger.info(
-            "Starting hybrid classification",
-            query_length=len(query.query_text),
-            user_id=query.user_id
-        )
+        result = self._classify_rules(query)
+        if self._needs_llm(result):
+            llm_result = self.llm_classifier.classify(query.query_text)
+            result = self._select_result(result, llm_result)
         
-        # Step 1: Try rule-based classification
-        rule_result = self.rule_classifier.classify(query.query_text)
+        return self._finish(result, start_ns)
+    
+    async def aclassify(self, query: QueryInput) -> ClassificationResult:
+        """
+        Classify query using hybrid approach, awaiting the LLM on escalation.
         
-        logger.info(
-            "Rule-based classification complete",
-            category=rule_result.category.value,
-            confidence=rule_result.confidence
-        )
+        The rule-based step stays synchronous (it is CPU-only and fast);
+        only the LLM call yields to the event loop.
         
-        # Step 2: Check if confidence is sufficient
-        if rule_result.confidence >= self.settings.confidence_threshold:
-            logger.info(
-                "Rule-based confidence sufficient, using rule result",
-                confidence=rule_result.confidence,
-                threshold=self.settings.confidence_threshold
+        Args:
+            query: QueryInput with query text and metadata
+            
+        Returns:
+            ClassificationResult from best classifier
+        """
+        start_ns = time.perf_counter_ns()
+        
+        result = self._classify_rules(query)
+        if self._needs_llm(result):
+            llm_result = await self.llm_classifier.classify_async(query.query_text)
+            result = self._select_result(result, llm_result)
+        
+        return self._finish(result, start_ns)
+    
+    def _classify_rules(self, query: QueryInput) -> ClassificationResult:
+        """
+        Step 1: Run rule-based classification.
+        
+        Args:
+            query: QueryInput with query text and metadata
+            
+        Returns:
+            Rule-based ClassificationResult
+        """
+        if self._debug_enabled:
+            logger.debug(
+                "Starting hybrid classification",
+                query_length=len(query.query_text),
+                user_id=query.user_id
             )
-            return rule_result
         
-        # Step 3: Escalate to LLM
-        logger.info(
-            "Rule-based confidence below threshold, escalating to LLM",
-            rule_confidence=rule_result.confidence,
-            threshold=self.settings.confidence_threshold
-        )
+        # Lowercase once; the rule classifier reuses it for routing keywords
+        query_text = query.query_text
+        rule_result = self.rule_classifier.classify(query_text, query_text.lower())
         
-        llm_result = self.llm_classifier.classify(query.query_text)
+        if self._debug_enabled:
+            logger.debug(
+                "Rule-based classification complete",
+                category=rule_result.category.value,
+                confidence=rule_result.confidence
+            )
         
-        logger.info(
-            "LLM classification complete",
-            category=llm_result.category.value,
-            confidence=llm_result.confidence
-        )
+        return rule_result
+    
+    def _needs_llm(self, rule_result: ClassificationResult) -> bool:
+        """
+        Step 2: Check whether rule confidence is sufficient.
+        
+        Results just below the threshold (within escalation_margin) are
+        kept without an LLM call unless the top two categories are close
+        (within ambiguity_gap), since the LLM rarely beats a clear winner.
         
-        # Step 4: Return LLM result (or rule result if LLM failed)
-        if llm_result.confidence > rule_result.confidence:
-            total_time_ms = (time.time() - start_time) * 1000
+        Args:
+            rule_result: Rule-based result
             
+        Returns:
+            True if the query should be escalated to the LLM
+        """
+        settings = self.settings
+        thr = settings.confidence_threshold
+        rule_conf = rule_result.confidence
+        
+        if rule_conf >= thr:
+            if self._debug_enabled:
+                logger.debug(
+                    "Rule-based confidence sufficient, using rule result",
+                    confidence=rule_conf,
+                    threshold=thr
+                )
+            return False
+        
+        top2_gap = self._top2_gap(rule_result)
+        
+        if rule_conf >= thr - settings.escalation_margin and top2_gap >= settings.ambiguity_gap:
+            if self._info_enabled:
+                logger.info(
+                    "Rule-based result near threshold and unambiguous, skipping LLM",
+                    confidence=rule_conf,
+                    threshold=thr,
+                    top2_gap=top2_gap
+                )
+            return False
+        
+        if self._info_enabled:
             logger.info(
-                "Using LLM result",
-                final_category=llm_result.category.value,
-                final_confidence=llm_result.confidence,
-                total_time_ms=total_time_ms
+                "Rule-based confidence below threshold, escalating to LLM",
+                rule_confidence=rule_conf,
+                threshold=thr,
+                top2_gap=top2_gap
             )
+        return True
+    
+    @staticmethod
+    def _top2_gap(rule_result: ClassificationResult) -> float:
+        """
+        Gap between the two highest category scores.
+        
+        Args:
+            rule_result: Rule-based result (with category_scores)
             
-            # Update response time to total time
-            llm_result.response_time_ms = total_time_ms
+        Returns:
+            Score difference (0.0 if fewer than two scores are available)
+        """
+        scores = sorted((rule_result.category_scores or {}).values(), reverse=True)
+        if len(scores) < 2:
+            return 0.0
+        return scores[0] - scores[1]
+    
+    def _select_result(
+        self,
+        rule_result: ClassificationResult,
+        llm_result: ClassificationResult
+    ) -> ClassificationResult:
+        """
+        Step 3: Return LLM result (or rule result if LLM failed).
+        
+        Args:
+            rule_result: Rule-based result
+            llm_result: LLM result
             
+        Returns:
+            The more confident of the two results
+        """
+        llm_cat = llm_result.category.value
+        llm_conf = llm_result.confidence
+        rule_conf = rule_result.confidence
+        
+        if self._debug_enabled:
+            logger.debug(
+                "LLM classification complete",
+                category=llm_cat,
+                confidence=llm_conf
+            )
+        
+        if llm_conf > rule_conf:
+            if self._debug_enabled:
+                logger.debug(
+                    "Using LLM result",
+                    final_category=llm_cat,
+                    final_confidence=llm_conf
+                )
             return llm_result
         else:
             logger.warning(
                 "LLM confidence not better than rules, using rule result",
-                llm_confidence=llm_result.confidence,
-                rule_confidence=rule_result.confidence
+                llm_confidence=llm_conf,
+                rule_confidence=rule_conf
             )
             return rule_result
     
+    def _finish(
+        self,
+        result: ClassificationResult,
+        start_ns: int
+    ) -> ClassificationResult:
+        """
+        Stamp the end-to-end response time on the final result.
+        
+        Args:
+            result: Selected result
+            start_ns: perf_counter_ns() at classification start
+            
+        Returns:
+            The same result, with response_time_ms set to total time
+        """
+        result.response_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        
+        if self._info_enabled:
+            logger.info(
+                "Hybrid classification complete",
+                category=result.category.value,
+                confidence=result.confidence,
+                method=result.method.value,
+                total_time_ms=result.response_time_ms
+            )
+        
+        return result
+    
     def classify_batch(self, queries: list[QueryInput]) -> list[ClassificationResult]:
         """
-        Classify multiple queries.
+        Classify multiple queries, running LLM escalations concurrently.
+        
+        Wall time is bounded by the slowest LLM call rather than the sum
+        of all of them. Runs on the shared background event loop, so it
+        is safe to call from sync code (including Streamlit callbacks).
         
         Args:
             queries: List of QueryInput objects
             
         Returns:
-            List of ClassificationResult objects
+            List of ClassificationResult objects (same order as queries)
+        """
+        return run_sync(self.classify_batch_async(queries))
+    
+    async def classify_batch_async(
+        self,
+        queries: list[QueryInput]
+    ) -> list[ClassificationResult]:
         """
-        logger.info(f"Starting batch classification", batch_size=len(queries))
+        Classify multiple queries concurrently (async callers).
         
-        results = []
-        for i, query in enumerate(queries):
-            logger.debug(f"Classifying query {i+1}/{len(queries)}")
-            result = self.classify(query)
-            results.append(result)
+        Args:
+            queries: List of QueryInput objects
+            
+        Returns:
+            List of ClassificationResult objects (same order as queries)
+        """
+        if self._debug_enabled:
+            logger.debug("Starting batch classification", batch_size=len(queries))
         
-        logger.info(f"Batch classification complete", results_count=len(results))
+        results = await asyncio.gather(*(self.aclassify(q) for q in queries))
         
-        return results
+        if self._debug_enabled:
+            logger.debug("Batch classification complete", results_count=len(results))
+        
+        return list(results)
 
 
 # ============================================================================
 # CONVENIENCE FUNCTION
 # ============================================================================
 
-_default_classifier = None
-
+@lru_cache()
 def get_classifier() -> HybridClassifier:
     """
     Get hybrid classifier instance (singleton).
     
     Returns:
-        HybridClassifier instance
+        Cached HybridClassifier instance
     """
-    global _default_classifier
-    
-    if _default_classifier is None:
-        _default_classifier = HybridClassifier()
-    
-    return _default_classifier
\ No newline at end of file
+    return HybridClassifier()
\ No newline at end of file
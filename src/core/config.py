@@ -48,6 +48,16 @@ class Settings(BaseSettings):
         description="Underlying model name"
     )
     
+    azure_openai_embedding_deployment: Optional[str] = Field(
+        default=None,
+        description="Embedding deployment for the semantic LLM cache (unset=disabled)"
+    )
+    
+    azure_openai_batch_deployment: Optional[str] = Field(
+        default=None,
+        description="Global-Batch deployment for offline jobs (unset=deployment_name)"
+    )
+    
     
     # APPLICATION SETTINGS
    
@@ -59,6 +69,20 @@ class Settings(BaseSettings):
         description="Minimum confidence to accept rule-based classification"
     )
     
+    escalation_margin: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=1.0,
+        description="Below-threshold band where a clear rule result skips the LLM"
+    )
+    
+    ambiguity_gap: float = Field(
+        default=0.15,
+        ge=0.0,
+        le=1.0,
+        description="Top-2 category score gap below which a query is ambiguous"
+    )
+    
     max_tokens: int = Field(
         default=150,
         ge=1,
@@ -73,6 +97,49 @@ class Settings(BaseSettings):
         description="LLM temperature (0=deterministic, 2=creative)"
     )
     
+    llm_structured_output: bool = Field(
+        default=True,
+        description="Constrain LLM output with a strict JSON schema (False=plain JSON mode)"
+    )
+    
+    llm_streaming: bool = Field(
+        default=False,
+        description="Stream single-query LLM responses and stop at the end of the JSON object"
+    )
+    
+    llm_cache_size: int = Field(
+        default=10_000,
+        ge=0,
+        description="Max cached LLM results, keyed on normalized query (0=disabled)"
+    )
+    
+    llm_cache_ttl_seconds: int = Field(
+        default=3600,
+        ge=1,
+        description="Seconds before a cached LLM result expires"
+    )
+    
+    semantic_cache_threshold: float = Field(
+        default=0.92,
+        ge=0.0,
+        le=1.0,
+        description="Minimum embedding cosine similarity to reuse a cached LLM result"
+    )
+    
+    llm_batch_size: int = Field(
+        default=1,
+        ge=1,
+        le=32,
+        description="Max concurrent LLM queries sent as one request (1=no batching)"
+    )
+    
+    llm_batch_wait_ms: int = Field(
+        default=50,
+        ge=0,
+        le=1000,
+        description="How long a query waits for others to join its LLM batch"
+    )
+    
     
     # LOGGING CONFIGURATION
     
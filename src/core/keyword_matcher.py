@@ -0,0 +1,74 @@
+"""
+Multi-pattern keyword matching for rule-based classification.
+
+Finds every known keyword that occurs in a text in a single scan,
+instead of one substring search per keyword per category.
+
+Backends (picked automatically):
+- Aho-Corasick automaton via ``pyahocorasick`` (linear in text length)
+- Plain substring checks over the de-duplicated keyword list (fallback)
+"""
+
+from typing import FrozenSet, Iterable
+
+try:
+    import ahocorasick  # Optional: pip install pyahocorasick
+except ImportError:  # pragma: no cover - depends on environment
+    ahocorasick = None
+
+from src.utils.logger import get_logger
+
+logger = get_logger()
+
+
+class KeywordMatcher:
+    """
+    Substring matcher over a fixed set of keywords.
+
+    Semantics match ``keyword in text`` for every keyword: matches may
+    overlap and are not restricted to word boundaries.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the matcher once (keywords are fixed afterwards).
+
+        Args:
+            keywords: Keywords to search for (duplicates are ignored)
+        """
+        # Preserve first-seen order, drop duplicates
+        self.keywords = tuple(dict.fromkeys(keywords))
+
+        self._automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+        logger.debug(
+            "KeywordMatcher initialized",
+            keywords=len(self.keywords),
+            backend=self.backend
+        )
+
+    @property
+    def backend(self) -> str:
+        """Name of the matching backend in use."""
+        return "aho-corasick" if self._automaton is not None else "substring"
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """
+        Find all keywords occurring in text.
+
+        Args:
+            text: Text to scan (already normalized by the caller)
+
+        Returns:
+            Set of matched keywords
+        """
+        if self._automaton is not None:
+            return frozenset(keyword for _, keyword in self._automaton.iter(text))
+
+        return frozenset(kw for kw in self.keywords if kw in text)
@@ -5,32 +5,328 @@ This is the fallback classifier for queries that rule-based
 classification cannot handle confidently.
 """
 
+import asyncio
 import json
+import random
 import time
-from typing import Optional, Dict, Any
+import weakref
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Optional, Dict, Any, List, Callable
 
-from openai import AzureOpenAI
+try:
+    import orjson  # Optional: pip install orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+try:
+    import httpx  # Installed with openai
+except ImportError:  # pragma: no cover - SDK builds on another HTTP stack
+    httpx = None
+
+try:
+    import h2  # noqa: F401  Optional: pip install httpx[http2]
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    HTTP2_AVAILABLE = False
+
+from openai import AzureOpenAI, AsyncAzureOpenAI
 from openai import APIError, RateLimitError, APITimeoutError
+from openai.types.chat import ChatCompletion
 
+from src.core.batching import BatchQueue
+from src.core.cache import ResultCache, SemanticCache
 from src.core.config import get_settings
+from pydantic import ValidationError
+
 from src.core.models import (
     ClassificationResult,
     SupportCategory,
-    ClassificationMethod
+    ClassificationMethod,
+    LLMClassificationOutput,
+    LLMBatchClassificationOutput
 )
-from src.utils.prompts import get_classification_prompt
-from src.utils.logger import get_logger
+from src.utils.async_runner import run_sync
+from src.utils.prompts import (
+    get_classification_prompt,
+    get_batch_classification_prompt
+)
+from src.utils.logger import get_logger, is_log_enabled
 
 logger = get_logger()
 
+# Fast JSON parsing when orjson is installed. orjson.JSONDecodeError
+# subclasses json.JSONDecodeError, so error handling is unchanged.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Per-query completion budget (a classification JSON object)
+CLASSIFICATION_MAX_TOKENS = 128
+
+# Shared connection pool for Azure OpenAI calls
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE = 32
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 90
+HTTP_CONNECT_TIMEOUT_SECONDS = 2.0
+HTTP_READ_TIMEOUT_SECONDS = 30.0
+
+# Rough prompt size for token estimates when a stream is cut early
+CHARS_PER_TOKEN = 4
+
+# Batch API job states after which polling stops
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Retry backoff: decorrelated jitter between these bounds (seconds)
+RETRY_BASE_SECONDS = 0.1
+RETRY_CAP_SECONDS = 4.0
+
+
+def _http_client_options() -> Dict[str, Any]:
+    """Pool limits and timeouts shared by the sync and async HTTP clients."""
+    return dict(
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS
+        ),
+        timeout=httpx.Timeout(
+            HTTP_READ_TIMEOUT_SECONDS,
+            connect=HTTP_CONNECT_TIMEOUT_SECONDS
+        ),
+        # Concurrent requests multiplex over one TLS connection
+        http2=HTTP2_AVAILABLE
+    )
+
+
+@lru_cache()
+def get_http_client() -> Optional["httpx.Client"]:
+    """
+    Get the pooled HTTP client for sync Azure OpenAI calls (singleton).
+    
+    Returns:
+        Shared httpx.Client, or None to use the SDK default
+    """
+    if httpx is None:
+        return None
+    return httpx.Client(**_http_client_options())
+
+
+# Async pools per event loop (see _for_running_loop)
+_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _for_running_loop(
+    clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]",
+    factory: Callable[[], Any]
+) -> Any:
+    """
+    Get (or build) the client kept for the running event loop.
+    
+    Async clients hold connections bound to the loop that opened them;
+    reusing one on another loop (e.g. a second asyncio.run()) fails with
+    "Event loop is closed". Must be called from a coroutine.
+    
+    Args:
+        clients: Per-loop client registry
+        factory: Builds a client for a loop that has none yet
+        
+    Returns:
+        The running loop's client
+    """
+    loop = asyncio.get_running_loop()
+    client = clients.get(loop)
+    if client is None:
+        # Pooled connections reference their loop, which can keep a weak
+        # key alive; drop entries for loops that have been closed
+        for closed in [other for other in clients if other.is_closed()]:
+            del clients[closed]
+        client = clients[loop] = factory()
+    return client
+
+
+def get_async_http_client() -> Optional["httpx.AsyncClient"]:
+    """
+    Get the pooled HTTP client for async calls on the running event loop.
+    
+    One client per loop (only the sync client is process-wide).
+    
+    Returns:
+        The loop's httpx.AsyncClient, or None to use the SDK default
+    """
+    if httpx is None:
+        return None
+    return _for_running_loop(
+        _async_http_clients,
+        lambda: httpx.AsyncClient(**_http_client_options())
+    )
+
+
+def _json_schema_format(name: str, model: Any) -> Dict[str, Any]:
+    """Strict structured-output response_format for a Pydantic model."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "strict": True,
+            "schema": model.model_json_schema()
+        }
+    }
+
+
+def _validate_json(model: Any, content: str) -> Optional[Any]:
+    """Validate raw JSON against an output model (None if it doesn't fit)."""
+    try:
+        return model.model_validate_json(content)
+    except ValidationError:
+        return None
+
+
+class _StreamedJSON:
+    """
+    Accumulates streamed text until the top-level JSON object closes.
+    
+    Tracks brace depth outside string literals, so braces inside the
+    reasoning text do not end the object early.
+    """
+    
+    def __init__(self):
+        self.parts: List[str] = []
+        self.chunks = 0
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escaped = False
+    
+    def feed(self, text: str) -> bool:
+        """
+        Add one streamed delta.
+        
+        Args:
+            text: Delta content
+            
+        Returns:
+            True once the top-level object is complete
+        """
+        self.parts.append(text)
+        self.chunks += 1
+        
+        for ch in text:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._depth += 1
+                self._started = True
+            elif ch == "}":
+                self._depth -= 1
+                if self._started and self._depth == 0:
+                    return True
+        return False
+    
+    def response(self, usage: Any, prompt: str) -> Any:
+        """
+        Build an object shaped like a (non-streamed) chat completion.
+        
+        Args:
+            usage: Usage from the stream's final chunk (None if the stream
+                was cut before it arrived)
+            prompt: Prompt sent, for estimating token usage
+            
+        Returns:
+            Object with choices[0].message.content and usage.total_tokens
+        """
+        if usage is None:
+            # ~1 token per content chunk, prompt estimated from its length
+            usage = SimpleNamespace(total_tokens=len(prompt) // CHARS_PER_TOKEN + self.chunks)
+        
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="".join(self.parts)))],
+            usage=usage
+        )
+
+
+def _bounded_reasoning(reasoning: Any) -> str:
+    """
+    Fit reasoning to ClassificationResult's 1-500 character limit.
+    
+    Args:
+        reasoning: Reasoning text (LLM-provided values may be any type)
+        
+    Returns:
+        Non-empty string of at most 500 characters
+    """
+    text = str(reasoning) if reasoning is not None else ""
+    return text[:500] if text else "LLM classification"
+
+
+def _retry_delay(error: Exception, prev_wait: Optional[float]) -> float:
+    """
+    Pick how long to wait before retrying a failed API call.
+    
+    Honours the server's Retry-After hint when present; otherwise uses
+    decorrelated jitter so concurrent retries don't hit the API in
+    lockstep.
+    
+    Args:
+        error: The exception from the failed call
+        prev_wait: Previous wait for this call (None on first retry)
+        
+    Returns:
+        Seconds to wait
+    """
+    retry_after = _retry_after_seconds(error)
+    if retry_after is not None:
+        return retry_after
+    
+    upper = prev_wait * 3 if prev_wait else RETRY_BASE_SECONDS * 3
+    return min(RETRY_CAP_SECONDS, random.uniform(RETRY_BASE_SECONDS, upper))
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Read the Retry-After hint from an API error's response headers.
+    
+    Args:
+        error: The exception from the failed call
+        
+    Returns:
+        Seconds to wait, or None if absent/unparseable
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(name)
+        if value:
+            try:
+                return max(0.0, float(value) * scale)
+            except ValueError:
+                pass  # HTTP-date form: fall back to jitter
+    return None
+
 
 class LLMClassifier:
     """
     LLM-based classifier using Azure OpenAI.
     
     Features:
-    - Structured JSON output
-    - Retry logic with exponential backoff
+    - Structured JSON output (strict JSON schema by default)
+    - Retry logic with jittered exponential backoff
+    - Two-tier cache: exact repeats, then near-duplicates by embedding
+    - Async variant for concurrent batch classification
+    - Optional micro-batching of concurrent calls into one request
+    - Batch API submission for offline bulk jobs
+    - Optional streaming that stops reading at the end of the JSON answer
+    - Shared keep-alive connection pool (HTTP/2 when h2 is installed)
     - Token usage tracking
     - Cost estimation
     - Error handling
@@ -42,15 +338,92 @@ class LLMClassifier:
         
         try:
             self.client = AzureOpenAI(
+                api_key=settings.azure_openai_api_key,
+                api_version=settings.azure_openai_api_version,
+                azure_endpoint=settings.azure_openai_endpoint,
+                http_client=get_http_client()  # Reused keep-alive pool
+            )
+            
+            # Async clients for concurrent calls (classify_async), one per
+            # event loop: see the aclient property
+            self._aclient_options = dict(
                 api_key=settings.azure_openai_api_key,
                 api_version=settings.azure_openai_api_version,
                 azure_endpoint=settings.azure_openai_endpoint
             )
+            self._aclients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncAzureOpenAI]" = (
+                weakref.WeakKeyDictionary()
+            )
             
             self.deployment_name = settings.azure_openai_deployment_name
-            self.max_tokens = settings.max_tokens
+            # LLM label -> enum: exact values plus lowercased values and
+            # short names ("billing", "bug", ...) the model sometimes returns
+            self._category_map = {}
+            for cat in SupportCategory:
+                self._category_map[cat.value] = cat
+                self._category_map[cat.value.lower()] = cat
+                self._category_map[cat.name.lower()] = cat
+            
+            self._system_message = {
+                "role": "system",
+                "content": "You are a precise support query classifier. Respond only with valid JSON."
+            }
+            # Constant fields of every fallback result (errors can arrive in
+            # bursts, e.g. rate-limit storms)
+            self._fallback_base = dict(
+                category=SupportCategory.GENERAL,
+                confidence=0.3,
+                method=ClassificationMethod.LLM_FALLBACK
+            )
+            # The JSON answer is ~60 tokens; a tight cap keeps the
+            # server-side reservation (and queueing) small
+            self.max_tokens = min(settings.max_tokens, CLASSIFICATION_MAX_TOKENS)
             self.temperature = settings.temperature
             
+            # Strict JSON schemas: the model can only return valid categories
+            self.structured_output = settings.llm_structured_output
+            if self.structured_output:
+                self._response_format = _json_schema_format(
+                    "classification", LLMClassificationOutput
+                )
+                self._batch_response_format = _json_schema_format(
+                    "batch_classification", LLMBatchClassificationOutput
+                )
+            else:
+                self._response_format = {"type": "json_object"}
+                self._batch_response_format = self._response_format
+            
+            # Stream single-query calls and stop at the closing brace
+            self.streaming = settings.llm_streaming
+            
+            # Skip per-call log argument building when the level is off
+            self._info_enabled = is_log_enabled("INFO")
+            self._debug_enabled = is_log_enabled("DEBUG")
+            
+            self.cache = ResultCache(
+                maxsize=settings.llm_cache_size,
+                ttl_seconds=settings.llm_cache_ttl_seconds
+            )
+            
+            # Semantic tier only runs when an embedding deployment is set
+            self.embedding_deployment = settings.azure_openai_embedding_deployment
+            self.batch_deployment = (
+                settings.azure_openai_batch_deployment or self.deployment_name
+            )
+            self.semantic_cache = SemanticCache(
+                maxsize=settings.llm_cache_size if self.embedding_deployment else 0,
+                threshold=settings.semantic_cache_threshold
+            )
+            
+            # Concurrent calls share one request when batching is enabled
+            self._batch_queue = None
+            if settings.llm_batch_size > 1:
+                self._batch_queue = BatchQueue(
+                    self._aclassify_batch,
+                    max_batch=settings.llm_batch_size,
+                    max_wait_ms=settings.llm_batch_wait_ms
+                )
+            
             logger.info(
                 "LLMClassifier initialized",
                 deployment=self.deployment_name,
@@ -58,9 +431,25 @@ class LLMClassifier:
             )
             
         except Exception as e:
-            logger.error(f"Failed to initialize Azure OpenAI client: {e}")
+            logger.error("Failed to initialize Azure OpenAI client", error=str(e))
             raise
     
+    @property
+    def aclient(self) -> AsyncAzureOpenAI:
+        """
+        Async Azure OpenAI client for the running event loop.
+        
+        Async callers may use their own loops (asyncio.run per call), so
+        each loop gets its own client and connection pool.
+        """
+        return _for_running_loop(
+            self._aclients,
+            lambda: AsyncAzureOpenAI(
+                **self._aclient_options,
+                http_client=get_async_http_client()
+            )
+        )
+    
     def classify(
         self,
         query_text: str,
@@ -76,14 +465,29 @@ class LLMClassifier:
         Returns:
             ClassificationResult with LLM classification
         """
+        if self._batch_queue is not None:
+            # Join the shared batch (runs on the background event loop)
+            return run_sync(self.classify_async(query_text, max_retries))
+        
         start_time = time.time()
         
-        logger.info("Starting LLM classification", query_length=len(query_text))
+        if self._info_enabled:
+            logger.info("Starting LLM classification", query_length=len(query_text))
+        
+        cached = self._get_cached(query_text, start_time)
+        if cached is not None:
+            return cached
+        
+        embedding = self._embed(query_text)
+        cached = self._get_similar(embedding, start_time)
+        if cached is not None:
+            return cached
         
         # Generate prompt
         prompt = get_classification_prompt(query_text)
         
         # Call LLM with retries
+        wait_time = None
         for attempt in range(1, max_retries + 1):
             try:
                 response = self._call_llm(prompt)
@@ -91,39 +495,48 @@ class LLMClassifier:
                 # Parse response
                 result = self._parse_response(response, query_text, start_time)
                 
-                logger.info(
-                    "LLM classification successful",
-                    category=result.category.value,
-                    confidence=result.confidence,
-                    tokens_used=result.llm_tokens_used,
-                    attempt=attempt
-                )
+                if self._info_enabled:
+                    logger.info(
+                        "LLM classification successful",
+                        category=result.category.value,
+                        confidence=result.confidence,
+                        tokens_used=result.llm_tokens_used,
+                        attempt=attempt
+                    )
+                
+                # Parse failures come back as fallbacks (no token usage)
+                if result.llm_tokens_used is not None:
+                    self._store(query_text, embedding, result)
                 
                 return result
                 
             except RateLimitError as e:
                 logger.warning(
-                    f"Rate limit hit, retrying ({attempt}/{max_retries})",
+                    "Rate limit hit",
+                    attempt=attempt,
+                    max_retries=max_retries,
                     error=str(e)
                 )
                 
                 if attempt < max_retries:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    logger.info(f"Waiting {wait_time}s before retry...")
+                    wait_time = _retry_delay(e, wait_time)
+                    logger.info("Waiting before retry", wait_seconds=wait_time)
                     time.sleep(wait_time)
                 else:
                     return self._create_fallback_result(query_text, start_time, str(e))
             
             except (APIError, APITimeoutError) as e:
-                logger.error(f"API error on attempt {attempt}: {e}")
+                logger.error("API error", attempt=attempt, error=str(e))
                 
                 if attempt < max_retries:
-                    time.sleep(1)
+                    wait_time = _retry_delay(e, wait_time)
+                    logger.info("Waiting before retry", wait_seconds=wait_time)
+                    time.sleep(wait_time)
                 else:
                     return self._create_fallback_result(query_text, start_time, str(e))
             
             except Exception as e:
-                logger.error(f"Unexpected error during LLM classification: {e}")
+                logger.error("Unexpected error during LLM classification", error=str(e))
                 return self._create_fallback_result(query_text, start_time, str(e))
         
         # Should never reach here, but just in case
@@ -133,36 +546,643 @@ class LLMClassifier:
             "Max retries exceeded"
         )
     
-    def _call_llm(self, prompt: str) -> Any:
+    async def classify_async(
+        self,
+        query_text: str,
+        max_retries: int = 3
+    ) -> ClassificationResult:
         """
-        Make API call to Azure OpenAI.
+        Classify query using Azure OpenAI without blocking the event loop.
+        
+        Same retry and fallback behaviour as classify(), so many calls can
+        run concurrently (e.g. with asyncio.gather).
         
         Args:
-            prompt: The prompt to send
+            query_text: The support query to classify
+            max_retries: Maximum retry attempts on failure
             
         Returns:
-            API response object
+            ClassificationResult with LLM classification
+        """
+        start_time = time.time()
+        
+        if self._info_enabled:
+            logger.info("Starting async LLM classification", query_length=len(query_text))
+        
+        cached = self._get_cached(query_text, start_time)
+        if cached is not None:
+            return cached
+        
+        embedding = await self._aembed(query_text)
+        cached = self._get_similar(embedding, start_time)
+        if cached is not None:
+            return cached
+        
+        if self._batch_queue is not None:
+            result = await self._batch_queue.submit(query_text)
+        else:
+            result = await self._aclassify_uncached(query_text, start_time, max_retries)
+        
+        # Parse failures come back as fallbacks (no token usage)
+        if result.llm_tokens_used is not None:
+            self._store(query_text, embedding, result)
+        
+        return result
+    
+    async def classify_many(
+        self,
+        queries: List[str],
+        max_concurrency: int = 10
+    ) -> List[ClassificationResult]:
+        """
+        Classify many queries concurrently (e.g. an offline CSV batch).
+        
+        At most max_concurrency requests are in flight at once, keeping
+        bursts within the deployment's rate limit. With batching enabled,
+        concurrent calls are further merged by the batch queue.
+        
+        Args:
+            queries: Support queries to classify
+            max_concurrency: Maximum concurrent classifications
+            
+        Returns:
+            List of ClassificationResult objects (same order as queries)
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def classify_one(query_text: str) -> ClassificationResult:
+            async with semaphore:
+                return await self.classify_async(query_text)
+        
+        logger.info(
+            "Starting concurrent LLM classification",
+            batch_size=len(queries),
+            max_concurrency=max_concurrency
+        )
+        
+        return list(await asyncio.gather(*(classify_one(q) for q in queries)))
+    
+    def classify_batch_offline(
+        self,
+        queries: List[str],
+        poll_interval: float = 30.0,
+        max_poll_interval: float = 600.0
+    ) -> List[ClassificationResult]:
+        """
+        Classify a bulk job through the Azure OpenAI Batch API.
+        
+        For offline workloads (e.g. re-classifying historical tickets):
+        one JSONL upload, billed at the batch rate and scheduled by Azure's
+        batch queue instead of per-minute quotas. Turnaround is up to 24
+        hours, so this blocks while polling; never call it on a request path.
+        
+        Args:
+            queries: Support queries to classify
+            poll_interval: Initial seconds between status checks
+            max_poll_interval: Cap for the doubling poll interval
+            
+        Returns:
+            List of ClassificationResult objects (same order as queries);
+            queries the job could not classify get fallback results
+        """
+        start_time = time.time()
+        
+        lines = []
+        for i, query_text in enumerate(queries):
+            body = self._request_kwargs(get_classification_prompt(query_text))
+            body["model"] = self.batch_deployment
+            lines.append(json.dumps({
+                "custom_id": f"q{i}",
+                "method": "POST",
+                "url": "/chat/completions",
+                "body": body
+            }))
+        
+        try:
+            input_file = self.client.files.create(
+                file=("classification_batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/chat/completions",
+                completion_window="24h"
+            )
+            
+            logger.info(
+                "Submitted batch classification job",
+                batch_id=batch.id,
+                batch_size=len(queries),
+                deployment=self.batch_deployment
+            )
+            
+            wait = poll_interval
+            while batch.status not in BATCH_TERMINAL_STATUSES:
+                time.sleep(wait)
+                wait = min(wait * 2, max_poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
+                logger.debug("Polled batch job", batch_id=batch.id, status=batch.status)
+            
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"Batch job {batch.id} ended with status {batch.status}")
+            
+            output = self.client.files.content(batch.output_file_id).text
+        except Exception as e:
+            logger.error("Batch classification job failed", error=str(e))
+            return [
+                self._create_fallback_result(q, start_time, f"Batch job failed: {e}")
+                for q in queries
+            ]
+        
+        results: List[Optional[ClassificationResult]] = [None] * len(queries)
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = _json_loads(line)
+                i = int(record["custom_id"][1:])
+                if not 0 <= i < len(queries):
+                    raise ValueError(f"custom_id {record['custom_id']!r} out of range")
+                response = record.get("response") or {}
+                
+                if response.get("status_code") == 200:
+                    completion = ChatCompletion.model_validate(response["body"])
+                    result = self._parse_response(completion, queries[i], start_time)
+                    # Batch tokens are billed at half the real-time rate
+                    if result.estimated_cost is not None:
+                        result.estimated_cost /= 2
+                else:
+                    error = record.get("error") or response.get("body", {}).get("error")
+                    result = self._create_fallback_result(
+                        queries[i], start_time, f"Batch request failed: {error}"
+                    )
+            except Exception as e:
+                # Left unset, the query falls back as missing below
+                logger.warning("Skipping unreadable batch output record", error=str(e))
+                continue
+            results[i] = result
+        
+        for i, result in enumerate(results):
+            if result is None:
+                # Failed requests are reported in the job's error file
+                results[i] = self._create_fallback_result(
+                    queries[i], start_time, "Missing from batch output"
+                )
+            elif result.llm_tokens_used is not None:
+                self._store(queries[i], None, result)
+        
+        logger.info(
+            "Batch classification job complete",
+            batch_id=batch.id,
+            batch_size=len(queries),
+            total_time_s=time.time() - start_time
+        )
+        
+        return results
+    
+    async def _aclassify_uncached(
+        self,
+        query_text: str,
+        start_time: float,
+        max_retries: int = 3
+    ) -> ClassificationResult:
+        """
+        Classify one query with its own API request (async, with retries).
+        
+        Args:
+            query_text: The support query to classify
+            start_time: Classification start time
+            max_retries: Maximum retry attempts on failure
+            
+        Returns:
+            ClassificationResult with LLM classification
+        """
+        prompt = get_classification_prompt(query_text)
+        
+        wait_time = None
+        for attempt in range(1, max_retries + 1):
+            try:
+                response = await self._acall_llm(prompt)
+                
+                result = self._parse_response(response, query_text, start_time)
+                
+                if self._info_enabled:
+                    logger.info(
+                        "LLM classification successful",
+                        category=result.category.value,
+                        confidence=result.confidence,
+                        tokens_used=result.llm_tokens_used,
+                        attempt=attempt
+                    )
+                
+                return result
+                
+            except RateLimitError as e:
+                logger.warning(
+                    "Rate limit hit",
+                    attempt=attempt,
+                    max_retries=max_retries,
+                    error=str(e)
+                )
+                
+                if attempt < max_retries:
+                    wait_time = _retry_delay(e, wait_time)
+                    logger.info("Waiting before retry", wait_seconds=wait_time)
+                    await asyncio.sleep(wait_time)
+                else:
+                    return self._create_fallback_result(query_text, start_time, str(e))
+            
+            except (APIError, APITimeoutError) as e:
+                logger.error("API error", attempt=attempt, error=str(e))
+                
+                if attempt < max_retries:
+                    wait_time = _retry_delay(e, wait_time)
+                    logger.info("Waiting before retry", wait_seconds=wait_time)
+                    await asyncio.sleep(wait_time)
+                else:
+                    return self._create_fallback_result(query_text, start_time, str(e))
+            
+            except Exception as e:
+                logger.error("Unexpected error during LLM classification", error=str(e))
+                return self._create_fallback_result(query_text, start_time, str(e))
+        
+        return self._create_fallback_result(
+            query_text,
+            start_time,
+            "Max retries exceeded"
+        )
+    
+    async def _aclassify_batch(
+        self,
+        queries: List[str],
+        max_retries: int = 3
+    ) -> List[ClassificationResult]:
+        """
+        Classify several queries with one API request (BatchQueue handler).
+        
+        The system prompt and instructions are sent once for the whole
+        batch; the response holds one JSON result per query.
+        
+        Args:
+            queries: Support queries to classify
+            max_retries: Maximum retry attempts on failure
+            
+        Returns:
+            One ClassificationResult per query, in order
+        """
+        start_time = time.time()
+        
+        if len(queries) == 1:
+            return [await self._aclassify_uncached(queries[0], start_time, max_retries)]
+        
+        prompt = get_batch_classification_prompt(queries)
+        max_tokens = min(self.max_tokens * len(queries), 4000)
+        
+        def fallback(error_msg: str) -> List[ClassificationResult]:
+            return [self._create_fallback_result(q, start_time, error_msg) for q in queries]
+        
+        wait_time = None
+        for attempt in range(1, max_retries + 1):
+            try:
+                response = await self._acall_llm(
+                    prompt,
+                    max_tokens=max_tokens,
+                    response_format=self._batch_response_format
+                )
+                
+                if self._info_enabled:
+                    logger.info(
+                        "LLM batch classification successful",
+                        batch_size=len(queries),
+                        tokens_used=response.usage.total_tokens,
+                        attempt=attempt
+                    )
+                
+                results = self._parse_batch_response(response, queries, start_time)
+                
+                # Queries without a matching entry get their own request
+                missing = [i for i, result in enumerate(results) if result is None]
+                if missing:
+                    logger.warning(
+                        "Classifying queries missing from LLM batch response singly",
+                        batch_size=len(queries),
+                        missing=len(missing)
+                    )
+                    singles = await asyncio.gather(*(
+                        self._aclassify_uncached(queries[i], start_time, max_retries)
+                        for i in missing
+                    ))
+                    for i, result in zip(missing, singles):
+                        results[i] = result
+                
+                return results
+                
+            except RateLimitError as e:
+                logger.warning(
+                    "Rate limit hit",
+                    attempt=attempt,
+                    max_retries=max_retries,
+                    batch_size=len(queries),
+                    error=str(e)
+                )
+                
+                if attempt < max_retries:
+                    wait_time = _retry_delay(e, wait_time)
+                    logger.info("Waiting before retry", wait_seconds=wait_time)
+                    await asyncio.sleep(wait_time)
+                else:
+                    return fallback(str(e))
+            
+            except (APIError, APITimeoutError) as e:
+                logger.error("API error", attempt=attempt, batch_size=len(queries), error=str(e))
+                
+                if attempt < max_retries:
+                    wait_time = _retry_delay(e, wait_time)
+                    logger.info("Waiting before retry", wait_seconds=wait_time)
+                    await asyncio.sleep(wait_time)
+                else:
+                    return fallback(str(e))
+            
+            except Exception as e:
+                logger.error("Unexpected error during LLM batch classification", error=str(e))
+                return fallback(str(e))
+        
+        return fallback("Max retries exceeded")
+    
+    def _get_cached(
+        self,
+        query_text: str,
+        start_time: float
+    ) -> Optional[ClassificationResult]:
         """
-        logger.debug("Calling Azure OpenAI API")
+        Return a copy of the cached result for this exact query, if any.
+        
+        Only successful LLM results are cached; fallbacks are retried.
         
-        response = self.client.chat.completions.create(
+        Args:
+            query_text: The support query
+            start_time: Classification start time
+            
+        Returns:
+            Fresh copy of the cached result, or None on miss
+        """
+        cached = self.cache.get(query_text)
+        if cached is None:
+            return None
+        return self._cache_hit(cached, start_time, "exact")
+    
+    def _get_similar(
+        self,
+        embedding: Optional[List[float]],
+        start_time: float
+    ) -> Optional[ClassificationResult]:
+        """
+        Return a copy of the result for a near-duplicate query, if any.
+        
+        Args:
+            embedding: Query embedding (None if semantic caching is off)
+            start_time: Classification start time
+            
+        Returns:
+            Fresh copy of the cached result, or None on miss
+        """
+        if embedding is None:
+            return None
+        
+        cached = self.semantic_cache.get(embedding)
+        if cached is None:
+            return None
+        return self._cache_hit(cached, start_time, "semantic")
+    
+    def _cache_hit(
+        self,
+        cached: ClassificationResult,
+        start_time: float,
+        tier: str
+    ) -> ClassificationResult:
+        """
+        Copy a cached result for return to the caller.
+        
+        Args:
+            cached: Stored result
+            start_time: Classification start time
+            tier: Which cache hit ("exact" or "semantic")
+            
+        Returns:
+            Copy with lookup time, zero cost and a cache tag in reasoning
+        """
+        if self._info_enabled:
+            logger.info("LLM cache hit", tier=tier, category=cached.category.value)
+        
+        tag = f" [cache:{tier}]"
+        
+        # No chat call was made: report lookup time and zero cost. The
+        # timestamp stays that of the original classification.
+        return cached.model_copy(update={
+            "reasoning": cached.reasoning[:500 - len(tag)] + tag,
+            "response_time_ms": (time.time() - start_time) * 1000,
+            "llm_tokens_used": 0,
+            "estimated_cost": 0.0
+        })
+    
+    def _store(
+        self,
+        query_text: str,
+        embedding: Optional[List[float]],
+        result: ClassificationResult
+    ) -> None:
+        """
+        Cache a successful LLM result in both tiers.
+        
+        Args:
+            query_text: The support query
+            embedding: Query embedding (None if semantic caching is off)
+            result: Result to cache (a copy is stored)
+        """
+        stored = result.model_copy()
+        self.cache.put(query_text, stored)
+        if embedding is not None:
+            self.semantic_cache.put(embedding, stored)
+    
+    def _embed(self, query_text: str) -> Optional[List[float]]:
+        """
+        Embed the query for semantic cache lookups.
+        
+        Args:
+            query_text: The support query
+            
+        Returns:
+            Embedding vector, or None if disabled or the call failed
+        """
+        if not self.embedding_deployment:
+            return None
+        
+        try:
+            response = self.client.embeddings.create(
+                model=self.embedding_deployment,
+                input=query_text
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning("Embedding failed, skipping semantic cache", error=str(e))
+            return None
+    
+    async def _aembed(self, query_text: str) -> Optional[List[float]]:
+        """
+        Embed the query for semantic cache lookups (async).
+        
+        Args:
+            query_text: The support query
+            
+        Returns:
+            Embedding vector, or None if disabled or the call failed
+        """
+        if not self.embedding_deployment:
+            return None
+        
+        try:
+            response = await self.aclient.embeddings.create(
+                model=self.embedding_deployment,
+                input=query_text
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning("Embedding failed, skipping semantic cache", error=str(e))
+            return None
+    
+    def _request_kwargs(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build chat completion arguments (shared by sync and async calls).
+        
+        Args:
+            prompt: The prompt to send
+            max_tokens: Override for batch requests (defaults to settings)
+            response_format: Override for batch requests (defaults to the
+                single-query format)
+            
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        return dict(
             model=self.deployment_name,  # This is your deployment name
             messages=[
-                {
-                    "role": "system",
-                    "content": "You are a precise support query classifier. Respond only with valid JSON."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
+                self._system_message,  # Built once in __init__
+                {"role": "user", "content": prompt}
             ],
             temperature=self.temperature,
-            max_tokens=self.max_tokens,
-            response_format={"type": "json_object"}  # Ensures JSON output
+            max_tokens=max_tokens or self.max_tokens,
+            response_format=response_format or self._response_format
+        )
+    
+    def _call_llm(self, prompt: str) -> Any:
+        """
+        Make API call to Azure OpenAI.
+        
+        Args:
+            prompt: The prompt to send
+            
+        Returns:
+            API response object
+        """
+        if self._debug_enabled:
+            logger.debug("Calling Azure OpenAI API")
+        
+        if self.streaming:
+            return self._call_llm_streaming(prompt)
+        
+        return self.client.chat.completions.create(**self._request_kwargs(prompt))
+    
+    def _call_llm_streaming(self, prompt: str) -> Any:
+        """
+        Stream the response and stop reading once the JSON object closes.
+        
+        Args:
+            prompt: The prompt to send
+            
+        Returns:
+            Object shaped like a chat completion response
+        """
+        stream = self.client.chat.completions.create(
+            **self._request_kwargs(prompt),
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        collector = _StreamedJSON()
+        usage = None
+        
+        try:
+            for chunk in stream:
+                if chunk.usage is not None:
+                    usage = chunk.usage
+                if chunk.choices and chunk.choices[0].delta.content:
+                    if collector.feed(chunk.choices[0].delta.content):
+                        break
+        finally:
+            stream.close()  # Drop the rest of the generation
+        
+        return collector.response(usage, prompt)
+    
+    async def _acall_llm(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Make async API call to Azure OpenAI.
+        
+        Args:
+            prompt: The prompt to send
+            max_tokens: Override for batch requests (defaults to settings)
+            
+        Returns:
+            API response object
+        """
+        if self._debug_enabled:
+            logger.debug("Calling Azure OpenAI API (async)")
+        
+        # Only single-query calls stream (batch calls pass their own format)
+        if self.streaming and response_format is None:
+            return await self._acall_llm_streaming(prompt)
+        
+        return await self.aclient.chat.completions.create(
+            **self._request_kwargs(prompt, max_tokens, response_format)
         )
+    
+    async def _acall_llm_streaming(self, prompt: str) -> Any:
+        """
+        Async variant of _call_llm_streaming().
         
-        return response
+        Args:
+            prompt: The prompt to send
+            
+        Returns:
+            Object shaped like a chat completion response
+        """
+        stream = await self.aclient.chat.completions.create(
+            **self._request_kwargs(prompt),
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        collector = _StreamedJSON()
+        usage = None
+        
+        try:
+            async for chunk in stream:
+                if chunk.usage is not None:
+                    usage = chunk.usage
+                if chunk.choices and chunk.choices[0].delta.content:
+                    if collector.feed(chunk.choices[0].delta.content):
+                        break
+        finally:
+            await stream.close()
+        
+        return collector.response(usage, prompt)
     
     def _parse_response(
         self,
@@ -184,53 +1204,28 @@ class LLMClassifier:
         # Extract content
         content = response.choices[0].message.content
         
-        logger.debug("Parsing LLM response", content_length=len(content))
+        if self._debug_enabled:
+            logger.debug("Parsing LLM response", content_length=len(content))
         
         try:
-            # Parse JSON
-            parsed = json.loads(content)
-            
-            category_str = parsed.get('category', 'General Inquiry')
-            confidence = float(parsed.get('confidence', 0.5))
-            reasoning = parsed.get('reasoning', 'LLM classification')
-            sentiment = parsed.get('sentiment', 'neutral')
-            urgency = parsed.get('urgency', 'normal')
-            
-            # Add sentiment/urgency to reasoning if present
-            if sentiment != 'neutral' or urgency != 'normal':
-                reasoning = f"{reasoning} [Sentiment: {sentiment}, Urgency: {urgency}]"
-            
-            # Validate category
-            try:
-                category = SupportCategory(category_str)
-            except ValueError:
-                logger.warning(
-                    f"Invalid category from LLM: {category_str}, using General"
-                )
-                category = SupportCategory.GENERAL
-            
             # Get token usage
             tokens_used = response.usage.total_tokens
             
-            # Estimate cost (GPT-4o-mini pricing: ~$0.15/1M input, ~$0.60/1M output)
-            # Rough estimate: $0.0004 per 1K tokens average
-            estimated_cost = (tokens_used / 1000) * 0.0004
+            # Schema-conforming output (strict structured outputs) is
+            # validated in one pass by pydantic-core
+            output = None
+            if self.structured_output:
+                output = _validate_json(LLMClassificationOutput, content)
             
-            response_time_ms = (time.time() - start_time) * 1000
+            if output is None:
+                # Plain JSON mode (or off-schema output): tolerant parsing
+                output = _json_loads(content)
             
-            return ClassificationResult(
-                category=category,
-                confidence=min(confidence, 0.95),  # Cap at 0.95
-                method=ClassificationMethod.LLM_FALLBACK,
-                reasoning=reasoning,
-                response_time_ms=response_time_ms,
-                llm_tokens_used=tokens_used,
-                estimated_cost=estimated_cost
-            )
+            return self._build_result(output, tokens_used, start_time)
             
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM JSON response: {e}")
-            logger.debug(f"Response content: {content}")
+            logger.error("Failed to parse LLM JSON response", error=str(e))
+            logger.debug("LLM response content", content=content)
             
             # Fallback
             return self._create_fallback_result(
@@ -240,13 +1235,158 @@ class LLMClassifier:
             )
         
         except Exception as e:
-            logger.error(f"Error parsing LLM response: {e}")
+            logger.error("Error parsing LLM response", error=str(e))
             return self._create_fallback_result(
                 query_text,
                 start_time,
                 str(e)
             )
     
+    def _parse_batch_response(
+        self,
+        response: Any,
+        queries: List[str],
+        start_time: float
+    ) -> List[Optional[ClassificationResult]]:
+        """
+        Parse a multi-query response once, matching entries to queries by id.
+        
+        Each entry carries its query's 1-based position as "id". A query
+        only gets a result from exactly one well-formed entry with its id,
+        so dropped, reordered or duplicated entries never shift results
+        onto other queries.
+        
+        Args:
+            response: API response object
+            queries: Support queries, in prompt order
+            start_time: Classification start time
+            
+        Returns:
+            One result per query; None where the response has no usable entry
+        """
+        content = response.choices[0].message.content
+        results: List[Optional[ClassificationResult]] = [None] * len(queries)
+        
+        if self._debug_enabled:
+            logger.debug("Parsing LLM batch response", content_length=len(content))
+        
+        try:
+            # Token usage is shared by the batch's queries
+            tokens_used = response.usage.total_tokens // len(queries)
+            
+            batch = None
+            if self.structured_output:
+                batch = _validate_json(LLMBatchClassificationOutput, content)
+            
+            if batch is not None:
+                entries = [(item.id, item) for item in batch.results]
+            else:
+                # Plain JSON mode (or off-schema output): tolerant parsing
+                entries = [
+                    (item.get('id') if isinstance(item, dict) else None, item)
+                    for item in _json_loads(content)['results']
+                ]
+        except Exception as e:
+            logger.error("Failed to parse LLM batch response", error=str(e))
+            return results
+        
+        # id -> entry; ids given more than once are ambiguous and unused
+        by_id: Dict[int, Any] = {}
+        duplicated = set()
+        for entry_id, item in entries:
+            if type(entry_id) is not int:
+                continue
+            if entry_id in by_id:
+                duplicated.add(entry_id)
+            by_id[entry_id] = item
+        
+        expected_ids = range(1, len(queries) + 1)
+        if len(entries) != len(queries) or duplicated or by_id.keys() != set(expected_ids):
+            logger.warning(
+                "LLM batch response ids do not match the queries",
+                batch_size=len(queries),
+                entries=len(entries),
+                duplicated_ids=sorted(duplicated)
+            )
+        
+        for i, entry_id in enumerate(expected_ids):
+            item = by_id.get(entry_id)
+            if item is None or entry_id in duplicated:
+                continue
+            try:
+                results[i] = self._build_result(item, tokens_used, start_time)
+            except Exception as e:
+                logger.warning("Unusable entry in LLM batch response", id=entry_id, error=str(e))
+        
+        return results
+    
+    def _build_result(
+        self,
+        output: Any,
+        tokens_used: int,
+        start_time: float
+    ) -> ClassificationResult:
+        """
+        Build a ClassificationResult from one parsed classification.
+        
+        Args:
+            output: Schema-validated LLMClassificationOutput, or a dict from
+                tolerant JSON parsing
+            tokens_used: Tokens attributed to this query
+            start_time: Classification start time
+            
+        Returns:
+            ClassificationResult (LLM values clamped to the model's limits)
+        """
+        if isinstance(output, LLMClassificationOutput):
+            category = output.category
+            confidence = output.confidence
+            reasoning = output.reasoning
+            sentiment = output.sentiment
+            urgency = output.urgency
+        else:
+            category_str = output.get('category', 'General Inquiry')
+            confidence = float(output.get('confidence', 0.5))
+            reasoning = output.get('reasoning', 'LLM classification')
+            sentiment = output.get('sentiment', 'neutral')
+            urgency = output.get('urgency', 'normal')
+            
+            # Validate category (exact label first, then tolerant variants)
+            category = None
+            if isinstance(category_str, str):
+                category = (
+                    self._category_map.get(category_str)
+                    or self._category_map.get(category_str.strip().lower())
+                )
+            if category is None:
+                logger.warning(
+                    "Invalid category from LLM, using General",
+                    category=category_str
+                )
+                category = SupportCategory.GENERAL
+        
+        # Add sentiment/urgency to reasoning if present
+        if sentiment != 'neutral' or urgency != 'normal':
+            reasoning = f"{reasoning} [Sentiment: {sentiment}, Urgency: {urgency}]"
+        
+        # Estimate cost (GPT-4o-mini pricing: ~$0.15/1M input, ~$0.60/1M output)
+        # Rough estimate: $0.0004 per 1K tokens average
+        estimated_cost = (tokens_used / 1000) * 0.0004
+        
+        now = time.time()
+        response_time_ms = (now - start_time) * 1000
+        
+        return ClassificationResult(
+            category=category,
+            confidence=round(max(0.0, min(confidence, 0.95)), 2),  # Cap at 0.95
+            method=ClassificationMethod.LLM_FALLBACK,
+            reasoning=_bounded_reasoning(reasoning),
+            response_time_ms=response_time_ms,
+            timestamp=datetime.fromtimestamp(now, tz=timezone.utc),
+            llm_tokens_used=tokens_used,
+            estimated_cost=estimated_cost
+        )
+    
     def _create_fallback_result(
         self,
         query_text: str,
@@ -264,16 +1404,16 @@ class LLMClassifier:
         Returns:
             ClassificationResult with low confidence
         """
-        response_time_ms = (time.time() - start_time) * 1000
+        now = time.time()
+        response_time_ms = (now - start_time) * 1000
         
         logger.warning("Using fallback classification due to LLM error")
         
         return ClassificationResult(
-            category=SupportCategory.GENERAL,
-            confidence=0.3,
-            method=ClassificationMethod.LLM_FALLBACK,
-            reasoning=f"LLM classification failed: {error_msg}",
-            response_time_ms=response_time_ms
+            **self._fallback_base,
+            reasoning=_bounded_reasoning(f"LLM classification failed: {error_msg}"),
+            response_time_ms=response_time_ms,
+            timestamp=datetime.fromtimestamp(now, tz=timezone.utc)
         )
 
 
@@ -281,18 +1421,12 @@ class LLMClassifier:
 # CONVENIENCE FUNCTION
 # ============================================================================
 
-_default_llm_classifier = None
-
+@lru_cache()
 def get_llm_classifier() -> LLMClassifier:
     """
     Get LLM classifier instance (singleton).
     
     Returns:
-        LLMClassifier instance
+        Cached LLMClassifier instance
     """
-    global _default_llm_classifier
-    
-    if _default_llm_classifier is None:
-        _default_llm_classifier = LLMClassifier()
-    
-    return _default_llm_classifier
\ No newline at end of file
+    return LLMClassifier()
\ No newline at end of file
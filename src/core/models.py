@@ -8,11 +8,17 @@ This module defines all data structures using Pydantic for:
 - Self-documenting code
 """
 
-from datetime import datetime
+import re
+from collections import Counter
+from datetime import datetime, timezone
 from typing import Optional, List, Literal
 from enum import Enum
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, ConfigDict, PrivateAttr
+
+
+# Letter candidates: word characters minus digits and underscore
+_ALPHA_RE = re.compile(r"[^\W\d_]")
 
 
 # ============================================================================
@@ -41,6 +47,18 @@ class ClassificationMethod(str, Enum):
     HYBRID = "hybrid"
 
 
+class RoutingPriority(str, Enum):
+    """
+    Suggested handling priority.
+    
+    A str Enum, so it compares equal to (and serializes as) its value.
+    """
+    CRITICAL = "critical"
+    HIGH = "high"
+    NORMAL = "normal"
+    LOW = "low"
+
+
 
 
 # ============================================================================
@@ -93,17 +111,14 @@ class QueryInput(BaseModel):
     
     @field_validator('query_text')
     @classmethod
-    def validate_query_not_empty(cls, v: str) -> str:
-        """Ensure query is not just whitespace."""
-        if not v or not v.strip():
+    def validate_query_text(cls, v: str) -> str:
+        """Ensure query is not just whitespace and contains some letters."""
+        v = v.strip()
+        if not v:
             raise ValueError("Query cannot be empty or whitespace only")
-        return v.strip()
-    
-    @field_validator('query_text')
-    @classmethod
-    def validate_query_language(cls, v: str) -> str:
-        """Basic check that query contains some alphabetic characters."""
-        if not any(c.isalpha() for c in v):
+        # Regex scan finds letter candidates in C; isalpha() rejects the
+        # few non-letters it admits (e.g. numeric symbols like "½")
+        if not any(m.group().isalpha() for m in _ALPHA_RE.finditer(v)):
             raise ValueError("Query must contain at least some text")
         return v
 
@@ -171,8 +186,8 @@ class ClassificationResult(BaseModel):
     )
     
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="When classification occurred"
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="When classification occurred (UTC, timezone-aware)"
     )
     
     # Optional details
@@ -209,8 +224,8 @@ class ClassificationResult(BaseModel):
         description="Confidence scores for all categories (for debugging)"
     )
     
-    routing_priority: str = Field(
-        default="normal",
+    routing_priority: RoutingPriority = Field(
+        default=RoutingPriority.NORMAL,
         description="Suggested routing priority: critical, high, normal, low"
     )
     
@@ -228,7 +243,7 @@ class ClassificationResult(BaseModel):
                     "method": "rule-based",
                     "reasoning": "Matched keywords: refund, charge",
                     "response_time_ms": 45.2,
-                    "timestamp": "2024-01-15T14:23:45.123456",
+                    "timestamp": "2024-01-15T14:23:45.123456+00:00",
                     "is_multi_intent": False,
                     "additional_categories": [],
                     "routing_priority": "normal",
@@ -265,6 +280,42 @@ class ClassificationResult(BaseModel):
 
 
 
+# ============================================================================
+# LLM OUTPUT SCHEMAS
+# ============================================================================
+
+class LLMClassificationOutput(BaseModel):
+    """
+    Raw LLM classification (the JSON object the model must return).
+    
+    Sent to Azure OpenAI as a strict JSON schema, so every field is
+    required and no extra keys are allowed. Confidence bounds are not in
+    the schema (strict mode rejects them); callers clamp it.
+    """
+    
+    model_config = ConfigDict(extra='forbid')
+    
+    category: SupportCategory
+    confidence: float
+    reasoning: str
+    sentiment: Literal["neutral", "polite", "confused", "frustrated", "angry", "urgent"]
+    urgency: Literal["low", "normal", "high", "critical"]
+
+
+class LLMBatchClassificationItem(LLMClassificationOutput):
+    """One entry of a multi-query LLM response."""
+    
+    id: int
+
+
+class LLMBatchClassificationOutput(BaseModel):
+    """Raw multi-query LLM response (one result per query, in order)."""
+    
+    model_config = ConfigDict(extra='forbid')
+    
+    results: List[LLMBatchClassificationItem]
+
+
 # ============================================================================
 # METRICS MODELS
 # ============================================================================
@@ -287,7 +338,42 @@ class SessionMetrics(BaseModel):
     total_tokens_used: int = Field(ge=0, default=0)
     estimated_total_cost: float = Field(ge=0.0, default=0.0)
     
-    category_distribution: dict[str, int] = Field(default_factory=dict)
+    # Counters: O(1) tallies and most_common() for the dashboard; they
+    # serialize as plain JSON objects
+    category_distribution: Counter[str] = Field(default_factory=Counter)
+    method_distribution: Counter[str] = Field(default_factory=Counter)
+    
+    # Running totals behind the averages
+    _confidence_sum: float = PrivateAttr(default=0.0)
+    _response_time_sum_ms: float = PrivateAttr(default=0.0)
+    
+    def record(self, result: ClassificationResult) -> None:
+        """
+        Fold one classification result into the metrics.
+        
+        O(1) per result: averages come from running sums, so the query
+        history is never rescanned.
+        
+        Args:
+            result: Classification result to add
+        """
+        self.total_queries += 1
+        
+        self.method_distribution[result.method.value] += 1
+        if result.method == ClassificationMethod.RULE_BASED:
+            self.rule_based_count += 1
+        elif result.method == ClassificationMethod.LLM_FALLBACK:
+            self.llm_fallback_count += 1
+        
+        self._confidence_sum += result.confidence
+        self._response_time_sum_ms += result.response_time_ms
+        self.average_confidence = self._confidence_sum / self.total_queries
+        self.average_response_time_ms = self._response_time_sum_ms / self.total_queries
+        
+        self.total_tokens_used += result.llm_tokens_used or 0
+        self.estimated_total_cost += result.estimated_cost or 0.0
+        
+        self.category_distribution[result.category.value] += 1
     
     def rule_based_percentage(self) -> float:
         """Calculate percentage of queries handled by rules."""
@@ -312,6 +398,10 @@ class SessionMetrics(BaseModel):
 # HELPER FUNCTIONS
 # ============================================================================
 
+_CATEGORY_BY_VALUE = {c.value: c for c in SupportCategory}
+_METHOD_BY_VALUE = {m.value: m for m in ClassificationMethod}
+
+
 def create_classification_result(
     category: str,
     confidence: float,
@@ -345,9 +435,14 @@ def create_classification_result(
         ...     response_time_ms=45.2
         ... )
     """
-    # Convert string category to enum
-    category_enum = SupportCategory(category)
-    method_enum = ClassificationMethod(method)
+    # Convert strings to enums (dict lookups; unknown values still raise)
+    category_enum = _CATEGORY_BY_VALUE.get(category)
+    if category_enum is None:
+        raise ValueError(f"{category!r} is not a valid SupportCategory")
+    
+    method_enum = _METHOD_BY_VALUE.get(method)
+    if method_enum is None:
+        raise ValueError(f"{method!r} is not a valid ClassificationMethod")
     
     return ClassificationResult(
         category=category_enum,
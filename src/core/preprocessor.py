@@ -12,10 +12,11 @@ Philosophy:
 
 import re
 import unicodedata
-from typing import List, Set
+from functools import lru_cache
+from typing import List
 from dataclasses import dataclass
 
-from src.utils.logger import get_logger
+from src.utils.logger import get_logger, is_log_enabled
 
 logger = get_logger()
 
@@ -24,12 +25,14 @@ logger = get_logger()
 # CONFIGURATION
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PreprocessingConfig:
     """
     Configuration for text preprocessing.
     
-    Allows customization of preprocessing behavior.
+    Allows customization of preprocessing behavior. Frozen: a
+    TextPreprocessor compiles its pipeline from the config once, so it
+    must not change afterwards (build a new config instead).
     """
     
     # Core operations
@@ -57,6 +60,32 @@ class PreprocessingConfig:
     min_length: int = 3
 
 
+# Cleaned strings memoized per preprocessor instance
+PREPROCESS_CACHE_SIZE = 4096
+
+# preprocess_many joins texts with this: no step matches or blanks it (it
+# is not whitespace, punctuation or a word character), so it survives as
+# a boundary that behaves like the start/end of each text
+BATCH_SEPARATOR = '\x00'
+
+# Common English stop words (shared by all preprocessor instances)
+STOP_WORDS = frozenset({
+    'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves',
+    'you', 'your', 'yours', 'yourself', 'yourselves',
+    'he', 'him', 'his', 'himself', 'she', 'her', 'hers', 'herself',
+    'it', 'its', 'itself', 'they', 'them', 'their', 'theirs',
+    'what', 'which', 'who', 'whom', 'this', 'that', 'these', 'those',
+    'am', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'having', 'do', 'does', 'did', 'doing',
+    'a', 'an', 'the', 'and', 'but', 'if', 'or', 'because', 'as',
+    'until', 'while', 'of', 'at', 'by', 'for', 'with', 'about',
+    'against', 'between', 'into', 'through', 'during', 'before',
+    'after', 'above', 'below', 'to', 'from', 'up', 'down', 'in',
+    'out', 'on', 'off', 'over', 'under', 'again', 'further',
+    'then', 'once'
+})
+
+
 
 
 # ============================================================================
@@ -82,23 +111,35 @@ class TextPreprocessor:
         # Compile regex patterns once (performance optimization)
         self._compile_patterns()
         
-        # Common English stop words (only if needed)
-        self._stop_words = self._load_stop_words()
+        # Memoize per instance: duplicate queries (templates, retries) skip
+        # every pass. Clear with preprocessor.preprocess.cache_clear().
+        self.preprocess = lru_cache(maxsize=PREPROCESS_CACHE_SIZE)(self._preprocess_impl)
+        
+        # Checked once: loguru builds the kwargs even for dropped messages
+        self._debug_enabled = is_log_enabled("DEBUG")
         
         logger.debug("TextPreprocessor initialized", config=self.config)
     
     def _compile_patterns(self):
         """Compile regex patterns for reuse (performance)."""
         
-        # URL pattern
-        self._url_pattern = re.compile(
-            r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        )
+        # URL pattern: one character class (the union of the former
+        # alternation, whose %XX branch was already covered by $-_), so the
+        # scan is a single linear run with no alternation backtracking
+        self._url_pattern = re.compile(r'https?://[!$-_a-z]+')
         
         # Email pattern
         self._email_pattern = re.compile(
             r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
         )
+        # Each run of local-part characters up to its '@', found once: the
+        # lookbehind stops restarts inside a run, which made plain sub()
+        # O(n^2) on long runs without a valid address
+        self._email_run_pattern = re.compile(r'(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]*+@')
+        self._word_boundary_pattern = re.compile(r'\b')
+        
+        # Non-ASCII characters other than common currency symbols
+        self._non_ascii_pattern = re.compile(r'[^\x00-\x7f€£¥]')
         
         # Multiple punctuation (!!!, ???, ...)
         self._multi_punct_pattern = re.compile(r'([!?.]){2,}')
@@ -108,33 +149,43 @@ class TextPreprocessor:
         
         # Special characters to remove (keep alphanumeric, basic punctuation, $)
         self._special_chars_pattern = re.compile(r'[^a-zA-Z0-9\s.,!?;:$\-]')
-    
-    def _load_stop_words(self) -> Set[str]:
-        """
-        Load common stop words.
         
-        Note: We rarely remove these for support queries,
-        but available if needed.
-        """
-        return {
-            'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves',
-            'you', 'your', 'yours', 'yourself', 'yourselves',
-            'he', 'him', 'his', 'himself', 'she', 'her', 'hers', 'herself',
-            'it', 'its', 'itself', 'they', 'them', 'their', 'theirs',
-            'what', 'which', 'who', 'whom', 'this', 'that', 'these', 'those',
-            'am', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-            'have', 'has', 'had', 'having', 'do', 'does', 'did', 'doing',
-            'a', 'an', 'the', 'and', 'but', 'if', 'or', 'because', 'as',
-            'until', 'while', 'of', 'at', 'by', 'for', 'with', 'about',
-            'against', 'between', 'into', 'through', 'during', 'before',
-            'after', 'above', 'below', 'to', 'from', 'up', 'down', 'in',
-            'out', 'on', 'off', 'over', 'under', 'again', 'further',
-            'then', 'once'
-        }
+        # Fused emoji + special-character + whitespace pass: every run of
+        # characters the three steps would blank (incl. whitespace) ends up
+        # as exactly one space, so one C-level sub replaces all three
+        self._not_kept_run_pattern = re.compile(r'[^a-zA-Z0-9.,!?;:$\-]+')
+        
+        # The two patterns above, keeping BATCH_SEPARATOR (preprocess_many)
+        self._batch_not_kept_run_pattern = re.compile(r'[^a-zA-Z0-9.,!?;:$\-\x00]+')
+        self._batch_special_chars_pattern = re.compile(r'[^a-zA-Z0-9\s.,!?;:$\-\x00]')
+        
+        # Keyword: a whitespace-delimited token with leading/trailing
+        # .,!?;:- stripped, at least 3 characters long (one scan instead of
+        # split + per-word strip + length filter)
+        self._keyword_pattern = re.compile(r'[^\s.,!?;:\-]\S+[^\s.,!?;:\-]')
+        
+        # Already-clean input for the fused pipeline: only kept characters
+        # and single spaces (lowercase only when lowercasing), with no
+        # punctuation pair to collapse; such text passes steps 1-7 unchanged
+        kept_letters = 'a-z' if self.config.lowercase else 'a-zA-Z'
+        self._clean_chars_pattern = re.compile(rf'[{kept_letters}0-9 .,!?;:$\-]+')
+        self._punct_pair_pattern = re.compile(r'[!?.]{2}')
+        
+        # Default pipeline: emoji/punctuation/whitespace steps can be fused
+        config = self.config
+        self._fused = (
+            config.remove_emojis
+            and config.normalize_punctuation
+            and config.remove_extra_punctuation
+            and config.normalize_whitespace
+        )
+        
+        # Non-fused pipeline: collapse + strip whitespace with split/join
+        self._split_whitespace = config.normalize_whitespace and config.strip_whitespace
     
-    def preprocess(self, text: str) -> str:
+    def _preprocess_impl(self, text: str) -> str:
         """
-        Main preprocessing pipeline.
+        Main preprocessing pipeline (called via the memoized preprocess).
         
         Args:
             text: Raw input text
@@ -152,35 +203,13 @@ class TextPreprocessor:
             return ""
         
         original_text = text
-        logger.debug("Preprocessing text", original_length=len(text))
-        
-        # Step 1: Remove URLs (before other processing)
-        if self.config.remove_urls:
-            text = self._remove_urls(text)
-        
-        # Step 2: Remove emails
-        if self.config.remove_emails:
-            text = self._remove_emails(text)
-        
-        # Step 3: Remove emojis and special Unicode
-        if self.config.remove_emojis:
-            text = self._remove_emojis(text)
-        
-        # Step 4: Normalize punctuation
-        if self.config.normalize_punctuation:
-            text = self._normalize_punctuation(text)
-        
-        # Step 5: Remove extra special characters
-        if self.config.remove_extra_punctuation:
-            text = self._remove_special_characters(text)
+        if self._debug_enabled:
+            logger.debug("Preprocessing text", original_length=len(text))
         
-        # Step 6: Lowercase
-        if self.config.lowercase:
-            text = text.lower()
-        
-        # Step 7: Normalize whitespace
-        if self.config.normalize_whitespace:
-            text = self._normalize_whitespace(text)
+        # Steps 1-7 (nothing to do for already-clean text, the common case
+        # for web-form input)
+        if not self._is_clean(text):
+            text = self._clean(self._remove_links(text))
         
         # Step 8: Strip leading/trailing whitespace
         if self.config.strip_whitespace:
@@ -199,11 +228,144 @@ class TextPreprocessor:
                 length=len(text)
             )
         
-        logger.debug(
-            "Preprocessing complete",
-            original_length=len(original_text),
-            processed_length=len(text)
+        if self._debug_enabled:
+            logger.debug(
+                "Preprocessing complete",
+                original_length=len(original_text),
+                processed_length=len(text)
+            )
+        
+        return text
+    
+    def preprocess_many(self, texts: List[str]) -> List[str]:
+        """
+        Preprocess a batch of texts.
+        
+        Joins the texts with BATCH_SEPARATOR and runs the character-level
+        passes (steps 3-7) once over the joined string, so a CSV upload or
+        eval run pays one regex call per step instead of one per text.
+        Results are identical to [preprocess(t) for t in texts].
+        
+        Args:
+            texts: Raw input texts
+            
+        Returns:
+            Cleaned texts, in input order
+        """
+        results = [""] * len(texts)
+        positions = []
+        batch = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                logger.warning("Empty text received for preprocessing")
+            elif BATCH_SEPARATOR in text:
+                # Cannot be joined; take the single-text path
+                results[i] = self.preprocess(text)
+            else:
+                positions.append(i)
+                batch.append(text)
+        
+        if not batch:
+            return results
+        
+        # URL/email removal stays per text: its substring guards skip most
+        # texts, which a joined string would defeat
+        joined = BATCH_SEPARATOR.join(self._remove_links(text) for text in batch)
+        cleaned = self._clean(joined, keep_separator=True)
+        
+        for i, original_text, text in zip(positions, batch, cleaned.split(BATCH_SEPARATOR)):
+            if self.config.strip_whitespace:
+                text = text.strip()
+            
+            if self.config.remove_stopwords:
+                text = self._remove_stopwords(text)
+            
+            if len(text) < self.config.min_length:
+                logger.warning(
+                    "Text too short after preprocessing",
+                    original=original_text,
+                    processed=text,
+                    length=len(text)
+                )
+            
+            results[i] = text
+        
+        if self._debug_enabled:
+            logger.debug("Batch preprocessing complete", count=len(texts))
+        
+        return results
+    
+    def _is_clean(self, text: str) -> bool:
+        """Check whether steps 1-7 would leave text unchanged (fused pipeline only)."""
+        return (
+            self._fused
+            and '  ' not in text
+            and self._clean_chars_pattern.fullmatch(text) is not None
+            and self._punct_pair_pattern.search(text) is None
         )
+    
+    def _remove_links(self, text: str) -> str:
+        """Run steps 1-2 of the pipeline (URL and email removal)."""
+        # Step 1: Remove URLs (before other processing; skipped when the
+        # text cannot contain one)
+        if self.config.remove_urls and '://' in text:
+            text = self._remove_urls(text)
+        
+        # Step 2: Remove emails
+        if self.config.remove_emails and '@' in text:
+            text = self._remove_emails(text)
+        
+        return text
+    
+    def _clean(self, text: str, keep_separator: bool = False) -> str:
+        """
+        Run the character-level steps (3-7) of the pipeline.
+        
+        Args:
+            text: Text with URLs and emails removed
+            keep_separator: Keep BATCH_SEPARATOR characters (used by
+                preprocess_many on joined input)
+            
+        Returns:
+            Text before stripping and stop-word removal
+        """
+        if keep_separator:
+            not_kept_run_pattern = self._batch_not_kept_run_pattern
+            special_chars_pattern = self._batch_special_chars_pattern
+        else:
+            not_kept_run_pattern = self._not_kept_run_pattern
+            special_chars_pattern = self._special_chars_pattern
+        
+        if self._fused:
+            # Steps 3-7 in two passes (punctuation runs, then everything
+            # else); only ASCII remains, so lowercasing order is irrelevant
+            text = self._normalize_punctuation(text)
+            text = not_kept_run_pattern.sub(' ', text)
+            if self.config.lowercase:
+                text = text.lower()
+        else:
+            # Step 3: Remove emojis and special Unicode
+            if self.config.remove_emojis:
+                text = self._remove_emojis(text)
+            
+            # Step 4: Normalize punctuation
+            if self.config.normalize_punctuation:
+                text = self._normalize_punctuation(text)
+            
+            # Step 5: Remove extra special characters
+            if self.config.remove_extra_punctuation:
+                text = special_chars_pattern.sub(' ', text)
+            
+            # Step 6: Lowercase
+            if self.config.lowercase:
+                text = text.lower()
+            
+            # Step 7: Normalize whitespace (also stripping when step 8 will
+            # strip anyway: str.split() does both in one pass, no regex)
+            if self._split_whitespace:
+                text = ' '.join(text.split())
+            elif self.config.normalize_whitespace:
+                text = self._normalize_whitespace(text)
         
         return text
     
@@ -212,8 +374,32 @@ class TextPreprocessor:
         return self._url_pattern.sub(' ', text)
     
     def _remove_emails(self, text: str) -> str:
-        """Remove email addresses from text."""
-        return self._email_pattern.sub(' ', text)
+        """
+        Remove email addresses from text.
+        
+        Same result as self._email_pattern.sub(' ', text), in linear time.
+        Every start inside one run shares the run's '@' and domain, so
+        sub() either matches from the run's first word boundary or not at
+        all; only that start is tried.
+        """
+        pieces = []
+        pos = 0
+        for run in self._email_run_pattern.finditer(text):
+            at = run.end() - 1
+            # A match ending inside this run's text resumes right after it
+            boundary = self._word_boundary_pattern.search(text, max(run.start(), pos), at)
+            if boundary is None or boundary.start() == at:
+                continue
+            match = self._email_pattern.match(text, boundary.start())
+            if match:
+                pieces.append(text[pos:match.start()])
+                pieces.append(' ')
+                pos = match.end()
+        
+        if not pieces:
+            return text
+        pieces.append(text[pos:])
+        return ''.join(pieces)
     
     def _remove_emojis(self, text: str) -> str:
         """
@@ -221,20 +407,12 @@ class TextPreprocessor:
         
         Keeps ASCII characters, basic Latin, and common symbols.
         """
-        # Keep ASCII printable characters and spaces
-        cleaned = []
-        for char in text:
-            # Keep if:
-            # - ASCII alphanumeric or punctuation
-            # - Or common currency symbols
-            if (ord(char) < 128 or  # ASCII
-                char in {'$', '€', '£', '¥'}):  # Currency
-                cleaned.append(char)
-            else:
-                # Replace emoji/Unicode with space
-                cleaned.append(' ')
+        # Most queries are pure ASCII: nothing to replace
+        if text.isascii():
+            return text
         
-        return ''.join(cleaned)
+        # Replace emoji/Unicode (one space per code point) in C
+        return self._non_ascii_pattern.sub(' ', text)
     
     def _normalize_punctuation(self, text: str) -> str:
         """
@@ -278,7 +456,7 @@ class TextPreprocessor:
         loses context. Use sparingly.
         """
         words = text.split()
-        filtered_words = [w for w in words if w not in self._stop_words]
+        filtered_words = [w for w in words if w not in STOP_WORDS]
         return ' '.join(filtered_words)
     
     def extract_keywords(self, text: str) -> List[str]:
@@ -298,22 +476,23 @@ class TextPreprocessor:
             >>> preprocessor.extract_keywords("My payment failed!")
             ['payment', 'failed']
         """
-        # Preprocess first
-        cleaned = self.preprocess(text)
-        
-        # Split into words
-        words = cleaned.split()
+        return self.split_keywords(self.preprocess(text))
+    
+    def split_keywords(self, cleaned_text: str) -> List[str]:
+        """
+        Extract keywords from already-preprocessed text.
         
-        # Strip punctuation from each word and filter out very short words
-        keywords = []
-        for word in words:
-            # Remove trailing/leading punctuation
-            word = word.strip('.,!?;:-')
-            # Keep if longer than 2 chars
-            if len(word) > 2:
-                keywords.append(word)
+        Args:
+            cleaned_text: Output of preprocess()
+            
+        Returns:
+            List of keywords (punctuation stripped)
+        """
+        # Words longer than 2 chars with trailing/leading punctuation removed
+        keywords = self._keyword_pattern.findall(cleaned_text)
         
-        logger.debug("Extracted keywords", count=len(keywords), keywords=keywords[:10])
+        if self._debug_enabled:
+            logger.debug("Extracted keywords", count=len(keywords), keywords=keywords[:10])
         
         return keywords
     
@@ -340,39 +519,41 @@ class TextPreprocessor:
         if len(words) < phrase_length:
             return []
         
-        phrases = []
-        for i in range(len(words) - phrase_length + 1):
-            phrase = ' '.join(words[i:i + phrase_length])
-            phrases.append(phrase)
-        
-        return phrases
+        # Zip offset views of the word list: one tuple per window, joined
+        # without slicing per position
+        windows = zip(*(words[i:] for i in range(phrase_length)))
+        return list(map(' '.join, windows))
 
 
 # ============================================================================
 # CONVENIENCE FUNCTION
 # ============================================================================
 
-# Global default preprocessor instance (singleton pattern)
-_default_preprocessor = None
+@lru_cache()
+def _default_preprocessor() -> TextPreprocessor:
+    """Default-config preprocessor, built once."""
+    return TextPreprocessor()
+
+
+@lru_cache()
+def _configured_preprocessor(config: PreprocessingConfig) -> TextPreprocessor:
+    """Preprocessor for a custom config, built once per equal config."""
+    return TextPreprocessor(config)
+
 
 def get_preprocessor(config: PreprocessingConfig = None) -> TextPreprocessor:
     """
     Get preprocessor instance (singleton).
     
     Args:
-        config: Custom configuration (creates new instance if provided)
+        config: Custom configuration (equal configs share one instance)
         
     Returns:
         TextPreprocessor instance
     """
-    global _default_preprocessor
-    
     if config is not None:
-        # Custom config requested, return new instance
-        return TextPreprocessor(config)
+        # Configs are frozen (hashable), so they can key the cache
+        return _configured_preprocessor(config)
     
     # Use cached default instance
-    if _default_preprocessor is None:
-        _default_preprocessor = TextPreprocessor()
-    
-    return _default_preprocessor
\ No newline at end of file
+    return _default_preprocessor()
\ No newline at end of file
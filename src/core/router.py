@@ -4,11 +4,13 @@ Smart Routing Logic for Support Queries.
 Routes queries based on classification results, priority, and multi-intent detection.
 """
 
-from typing import List, Dict, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, List, Dict, Optional, Tuple
 from enum import Enum
 
-from src.core.models import ClassificationResult, SupportCategory
-from src.utils.logger import get_logger
+from src.core.models import ClassificationResult, SupportCategory, RoutingPriority
+from src.utils.logger import get_logger, is_log_enabled
 
 logger = get_logger()
 
@@ -37,28 +39,92 @@ class RoutingAction(str, Enum):
     QUEUE_PRIORITY = "queue_priority"  # Priority queue
 
 
+@dataclass(slots=True, frozen=True)
 class RoutingDecision:
-    """Complete routing decision for a query."""
+    """Complete routing decision for a query (immutable)."""
     
-    def __init__(
-        self,
-        destination: RoutingDestination,
-        action: RoutingAction,
-        priority: str,
-        estimated_wait_time: str,
-        reasoning: str,
-        requires_split: bool = False,
-        split_categories: Optional[List[SupportCategory]] = None,
-        special_instructions: Optional[str] = None
-    ):
-        self.destination = destination
-        self.action = action
-        self.priority = priority
-        self.estimated_wait_time = estimated_wait_time
-        self.reasoning = reasoning
-        self.requires_split = requires_split
-        self.split_categories = split_categories or []
-        self.special_instructions = special_instructions
+    destination: RoutingDestination
+    action: RoutingAction
+    priority: RoutingPriority
+    estimated_wait_time: str
+    reasoning: str
+    requires_split: bool = False
+    split_categories: List[SupportCategory] = field(default_factory=list)
+    special_instructions: Optional[str] = None
+
+
+# High-confidence routing per category: (destination, wait time, reason)
+_ROUTING_MAP: Dict[SupportCategory, Tuple[RoutingDestination, str, str]] = {
+    SupportCategory.BILLING: (
+        RoutingDestination.SPECIALIST_BILLING,
+        "10-20 minutes",
+        "Billing specialist for payment issues"
+    ),
+    SupportCategory.TECHNICAL: (
+        RoutingDestination.SPECIALIST_TECHNICAL,
+        "15-25 minutes",
+        "Technical specialist for troubleshooting"
+    ),
+    SupportCategory.ACCOUNT: (
+        RoutingDestination.TIER_1_SUPPORT,
+        "5-10 minutes",
+        "Tier 1 support for account management"
+    ),
+    SupportCategory.FEATURE: (
+        RoutingDestination.TIER_2_SUPPORT,
+        "1-2 hours",
+        "Product team for feature request evaluation"
+    ),
+    SupportCategory.BUG: (
+        RoutingDestination.SPECIALIST_TECHNICAL,
+        "20-30 minutes",
+        "Technical team for bug investigation"
+    ),
+    SupportCategory.PRODUCT: (
+        RoutingDestination.TIER_1_SUPPORT,
+        "5-15 minutes",
+        "General support for product questions"
+    ),
+    SupportCategory.GENERAL: (
+        RoutingDestination.AUTO_RESPONSE,
+        "Immediate",
+        "Automated FAQ response system"
+    ),
+}
+
+_DEFAULT_ROUTE = (RoutingDestination.TIER_1_SUPPORT, "10-20 minutes", "General support queue")
+
+_PRIORITY_QUEUE_LEVELS = frozenset({RoutingPriority.CRITICAL, RoutingPriority.HIGH})
+
+
+def _category_route(
+    destination: RoutingDestination,
+    wait_time: str,
+    reason: str
+) -> Callable[[ClassificationResult], RoutingDecision]:
+    """
+    Build the high-confidence route function for one category.
+    
+    The table entry is bound into the closure once, so routing a query
+    is a single call with no table unpacking.
+    """
+    def route(result: ClassificationResult) -> RoutingDecision:
+        # High priority queries go to priority queue
+        action = (
+            RoutingAction.QUEUE_PRIORITY
+            if result.routing_priority in _PRIORITY_QUEUE_LEVELS
+            else RoutingAction.QUEUE_NORMAL
+        )
+        
+        return RoutingDecision(
+            destination=destination,
+            action=action,
+            priority=result.routing_priority,
+            estimated_wait_time=wait_time,
+            reasoning=f"{reason}. Confidence: {result.confidence:.0%}"
+        )
+    
+    return route
 
 
 # ============================================================================
@@ -79,6 +145,14 @@ class SmartRouter:
     
     def __init__(self):
         """Initialize smart router with routing rules."""
+        self._info_enabled = is_log_enabled("INFO")
+        
+        # One prebuilt route function per category
+        self._category_routes: Dict[SupportCategory, Callable[[ClassificationResult], RoutingDecision]] = {
+            category: _category_route(*entry) for category, entry in _ROUTING_MAP.items()
+        }
+        self._default_route = _category_route(*_DEFAULT_ROUTE)
+        
         logger.debug("SmartRouter initialized")
     
     def route(self, result: ClassificationResult) -> RoutingDecision:
@@ -91,20 +165,21 @@ class SmartRouter:
         Returns:
             RoutingDecision with destination and action
         """
-        logger.info(
-            "Routing query",
-            category=result.category.value,
-            confidence=result.confidence,
-            is_multi_intent=result.is_multi_intent,
-            priority=result.routing_priority
-        )
+        if self._info_enabled:
+            logger.info(
+                "Routing query",
+                category=result.category.value,
+                confidence=result.confidence,
+                is_multi_intent=result.is_multi_intent,
+                priority=result.routing_priority.value
+            )
         
         # Handle multi-intent queries specially
         if result.is_multi_intent:
             return self._route_multi_intent(result)
         
         # Handle by priority
-        if result.routing_priority == "critical":
+        if result.routing_priority == RoutingPriority.CRITICAL:
             return self._route_critical(result)
         
         # Handle low confidence queries
@@ -144,7 +219,7 @@ class SmartRouter:
         return RoutingDecision(
             destination=RoutingDestination.MULTI_INTENT_TRIAGE,
             action=RoutingAction.SPLIT_TICKETS,
-            priority="high",
+            priority=RoutingPriority.HIGH,
             estimated_wait_time="Immediate triage",
             reasoning=(
                 f"Complex multi-intent query with {intent_count} distinct issues. "
@@ -168,7 +243,7 @@ class SmartRouter:
         return RoutingDecision(
             destination=RoutingDestination.ESCALATION_TEAM,
             action=RoutingAction.ESCALATE_IMMEDIATELY,
-            priority="critical",
+            priority=RoutingPriority.CRITICAL,
             estimated_wait_time="Immediate",
             reasoning=(
                 f"Critical issue detected in {result.category.value}. "
@@ -198,74 +273,14 @@ class SmartRouter:
     def _route_by_category(self, result: ClassificationResult) -> RoutingDecision:
         """Route based on category with high confidence."""
         
-        routing_map = {
-            SupportCategory.BILLING: (
-                RoutingDestination.SPECIALIST_BILLING,
-                "10-20 minutes",
-                "Billing specialist for payment issues"
-            ),
-            SupportCategory.TECHNICAL: (
-                RoutingDestination.SPECIALIST_TECHNICAL,
-                "15-25 minutes",
-                "Technical specialist for troubleshooting"
-            ),
-            SupportCategory.ACCOUNT: (
-                RoutingDestination.TIER_1_SUPPORT,
-                "5-10 minutes",
-                "Tier 1 support for account management"
-            ),
-            SupportCategory.FEATURE: (
-                RoutingDestination.TIER_2_SUPPORT,
-                "1-2 hours",
-                "Product team for feature request evaluation"
-            ),
-            SupportCategory.BUG: (
-                RoutingDestination.SPECIALIST_TECHNICAL,
-                "20-30 minutes",
-                "Technical team for bug investigation"
-            ),
-            SupportCategory.PRODUCT: (
-                RoutingDestination.TIER_1_SUPPORT,
-                "5-15 minutes",
-                "General support for product questions"
-            ),
-            SupportCategory.GENERAL: (
-                RoutingDestination.AUTO_RESPONSE,
-                "Immediate",
-                "Automated FAQ response system"
-            ),
-        }
-        
-        destination, wait_time, reason = routing_map.get(
-            result.category,
-            (RoutingDestination.TIER_1_SUPPORT, "10-20 minutes", "General support queue")
-        )
-        
-        # High priority queries go to priority queue
-        action = (
-            RoutingAction.QUEUE_PRIORITY 
-            if result.routing_priority in ["critical", "high"]
-            else RoutingAction.QUEUE_NORMAL
-        )
-        
-        return RoutingDecision(
-            destination=destination,
-            action=action,
-            priority=result.routing_priority,
-            estimated_wait_time=wait_time,
-            reasoning=f"{reason}. Confidence: {result.confidence:.0%}"
-        )
+        return self._category_routes.get(result.category, self._default_route)(result)
 
 
 # ============================================================================
 # SINGLETON
 # ============================================================================
 
-_router_instance = None
-
+@lru_cache()
 def get_router() -> SmartRouter:
     """Get router singleton."""
-    global _router_instance
-    if _router_instance is None:
-        _router_instance = SmartRouter()
-    return _router_instance
+    return SmartRouter()
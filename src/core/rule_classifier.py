@@ -6,12 +6,21 @@ No LLM calls = free and instant!
 """
 
 import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass
 from functools import lru_cache
-from typing import Dict, List, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
-from src.core.models import ClassificationResult, SupportCategory, ClassificationMethod
+from src.core.models import (
+    ClassificationResult,
+    SupportCategory,
+    ClassificationMethod,
+    RoutingPriority
+)
 from src.core.preprocessor import get_preprocessor
-from src.utils.logger import get_logger
+from src.core.keyword_matcher import KeywordMatcher
+from src.utils.logger import get_logger, is_log_enabled
 
 logger = get_logger()
 
@@ -97,10 +106,48 @@ CATEGORY_PATTERNS = {
 }
 
 
+# Routing keywords (substring matches against the lowercased raw query)
+CRITICAL_KEYWORDS = [
+    'urgent', 'emergency', 'critical', 'asap', 'immediately',
+    'can\'t access', 'cannot access', 'locked out', 'fraud',
+    'unauthorized', 'hacked', 'stolen', 'security breach'
+]
+
+HIGH_PRIORITY_KEYWORDS = [
+    'crash', 'error', 'down', 'not working', 'broken',
+    'charged twice', 'double charge', 'refund', 'money back',
+    'forgot password', 'reset password'
+]
+
+
+# Rule analyses memoized per classifier instance (keyed on cleaned text)
+CLASSIFY_CACHE_SIZE = 4096
+
+# Priority keyword flags memoized per classifier (keyed on lowercased query)
+ROUTING_CACHE_SIZE = 2048
+
+# Category -> value string, looked up without the Enum.value descriptor
+_CATEGORY_VALUES = {category: category.value for category in SupportCategory}
+
+
 # ============================================================================
 # RULE CLASSIFIER CLASS
 # ============================================================================
 
+@dataclass(slots=True, frozen=True)
+class _RuleAnalysis:
+    """Everything classify() derives from the cleaned text alone."""
+    
+    category: SupportCategory
+    confidence: float
+    category_scores: Dict[str, float]
+    additional_categories: Tuple[SupportCategory, ...]
+    additional_values: Tuple[str, ...]
+    is_multi_intent: bool
+    match_count: int
+    reasoning: str
+
+
 class RuleBasedClassifier:
     """
     Fast rule-based classifier using keyword matching.
@@ -118,35 +165,131 @@ class RuleBasedClassifier:
         self.preprocessor = get_preprocessor()
         self.patterns = CATEGORY_PATTERNS
         
+        # Pattern groups flattened in table order: group id -> (category,
+        # group size, weight), and keyword -> ids of every group containing it
+        groups: List[Tuple[SupportCategory, int, float]] = []
+        keyword_groups: Dict[str, List[int]] = defaultdict(list)
+        for category, pattern_groups in self.patterns.items():
+            for pattern_keywords, weight in pattern_groups:
+                group_id = len(groups)
+                groups.append((category, len(pattern_keywords), float(weight)))
+                for pk in dict.fromkeys(pattern_keywords):
+                    keyword_groups[pk].append(group_id)
+        
+        # Frozen for scoring: read-only tuples, and a plain dict so a lookup
+        # can never insert an empty entry
+        self._groups: Tuple[Tuple[SupportCategory, int, float], ...] = tuple(groups)
+        self._keyword_groups: Dict[str, Tuple[int, ...]] = {
+            pk: tuple(group_ids) for pk, group_ids in keyword_groups.items()
+        }
+        
+        # One multi-pattern scan per query instead of one search per keyword
+        self.matcher = KeywordMatcher(self._keyword_groups)
+        
+        # Per-category pattern keywords for the explanation (intersected
+        # with the query's keyword set instead of scanning its list)
+        self._category_keywords: Dict[SupportCategory, FrozenSet[str]] = {
+            category: frozenset(pk for pattern_keywords, _ in pattern_groups for pk in pattern_keywords)
+            for category, pattern_groups in self.patterns.items()
+        }
+        
+        # Memoize the text-only part of classify: repeated and templated
+        # queries skip scoring (routing still sees the raw query). Clear
+        # with classifier.analyze.cache_clear().
+        self.analyze = lru_cache(maxsize=CLASSIFY_CACHE_SIZE)(self._analyze_impl)
+        
+        # Checked once: loguru builds the kwargs even for dropped messages
+        self._debug_enabled = is_log_enabled("DEBUG")
+        
+        # Routing: one scan for both priority keyword lists, memoized on the
+        # lowercased query (FAQ-style repeats skip it)
+        self._critical_keywords = frozenset(CRITICAL_KEYWORDS)
+        self._high_keywords = frozenset(HIGH_PRIORITY_KEYWORDS)
+        self.routing_matcher = KeywordMatcher(CRITICAL_KEYWORDS + HIGH_PRIORITY_KEYWORDS)
+        self.priority_flags = lru_cache(maxsize=ROUTING_CACHE_SIZE)(self._priority_flags_impl)
+        
         logger.debug(
             "RuleBasedClassifier initialized",
-            categories=len(self.patterns)
+            categories=len(self.patterns),
+            matcher=self.matcher.backend
         )
     
-    def classify(self, query_text: str) -> ClassificationResult:
+    def classify(
+        self,
+        query_text: str,
+        normalized_text: Optional[str] = None
+    ) -> ClassificationResult:
         """
         Classify query using keyword patterns.
         
         Args:
             query_text: Raw query text from user
+            normalized_text: query_text.lower(), if the caller already has it
             
         Returns:
             ClassificationResult with category and confidence
         """
-        import time
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        # Preprocess text
+        # Preprocess text, then score it (memoized on the cleaned text)
         cleaned_text = self.preprocessor.preprocess(query_text)
-        keywords = self.preprocessor.extract_keywords(query_text)
+        analysis = self.analyze(cleaned_text)
         
-        logger.debug(
-            "Classifying with rules",
-            original_length=len(query_text),
-            cleaned_length=len(cleaned_text),
-            keywords_count=len(keywords)
+        # Determine routing priority and human review need
+        routing_priority, requires_human = self._determine_routing(
+            analysis.category,
+            analysis.confidence,
+            analysis.is_multi_intent,
+            normalized_text if normalized_text is not None else query_text.lower()
         )
         
+        # Calculate response time
+        response_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        
+        if self._debug_enabled:
+            logger.debug(
+                "Rule-based classification complete",
+                category=analysis.category.value,
+                confidence=analysis.confidence,
+                matches=analysis.match_count,
+                is_multi_intent=analysis.is_multi_intent,
+                additional_categories=list(analysis.additional_values),
+                routing_priority=routing_priority.value,
+                response_time_ms=response_time_ms
+            )
+        
+        return ClassificationResult(
+            category=analysis.category,
+            confidence=analysis.confidence,
+            reasoning=analysis.reasoning,
+            method=ClassificationMethod.RULE_BASED,
+            response_time_ms=response_time_ms,
+            is_multi_intent=analysis.is_multi_intent,
+            additional_categories=list(analysis.additional_categories),
+            category_scores=dict(analysis.category_scores),
+            routing_priority=routing_priority,
+            requires_human_review=requires_human
+        )
+    
+    def _analyze_impl(self, cleaned_text: str) -> _RuleAnalysis:
+        """
+        Score preprocessed text (called via the memoized analyze).
+        
+        Args:
+            cleaned_text: Output of the preprocessor for the query
+            
+        Returns:
+            Category, confidence, scores, multi-intent and reasoning
+        """
+        keywords = self.preprocessor.split_keywords(cleaned_text)
+        
+        if self._debug_enabled:
+            logger.debug(
+                "Classifying with rules",
+                cleaned_length=len(cleaned_text),
+                keywords_count=len(keywords)
+            )
+        
         # Calculate scores for each category
         category_scores = self._calculate_category_scores(
             cleaned_text,
@@ -168,45 +311,24 @@ class RuleBasedClassifier:
             keywords
         )
         
-        # Determine routing priority and human review need
-        routing_priority, requires_human = self._determine_routing(
-            best_category,
-            confidence,
-            is_multi_intent,
-            query_text
-        )
+        # Value strings of the additional categories (reasoning and log)
+        additional_values = tuple([_CATEGORY_VALUES[cat] for cat in additional_categories])
         
         # Build reasoning
         reasoning = f"Matched {len(matched_patterns)} patterns: {', '.join(matched_patterns[:3])}"
         if is_multi_intent:
-            other_cats = ', '.join([cat.value for cat in additional_categories])
+            other_cats = ', '.join(additional_values)
             reasoning += f" | Also detected: {other_cats}"
         
-        # Calculate response time
-        response_time_ms = (time.time() - start_time) * 1000
-        
-        logger.info(
-            "Rule-based classification complete",
-            category=best_category.value,
-            confidence=confidence,
-            matches=len(matched_patterns),
-            is_multi_intent=is_multi_intent,
-            additional_categories=[c.value for c in additional_categories],
-            routing_priority=routing_priority,
-            response_time_ms=response_time_ms
-        )
-        
-        return ClassificationResult(
+        return _RuleAnalysis(
             category=best_category,
             confidence=confidence,
-            reasoning=reasoning,
-            method=ClassificationMethod.RULE_BASED,
-            response_time_ms=response_time_ms,
+            category_scores={_CATEGORY_VALUES[cat]: score for cat, score in category_scores.items()},
+            additional_categories=tuple(additional_categories),
+            additional_values=additional_values,
             is_multi_intent=is_multi_intent,
-            additional_categories=additional_categories,
-            category_scores={cat.value: score for cat, score in category_scores.items()},
-            routing_priority=routing_priority,
-            requires_human_review=requires_human
+            match_count=len(matched_patterns),
+            reasoning=reasoning
         )
     
     def _calculate_category_scores(
@@ -226,25 +348,30 @@ class RuleBasedClassifier:
         """
         scores = {}
         
-        for category, pattern_groups in self.patterns.items():
-            total_score = 0.0
-            match_count = 0
-            
-            for pattern_keywords, weight in pattern_groups:
-                # Check if any pattern keyword is in our keywords
-                matches = sum(
-                    1 for pk in pattern_keywords
-                    if pk in keywords or pk in text
-                )
-                
-                if matches > 0:
-                    # Score based on match ratio and weight
-                    match_ratio = matches / len(pattern_keywords)
-                    total_score += match_ratio * weight
-                    match_count += 1
+        # Single scan of the text; keywords are tokens of the same text,
+        # so every keyword hit is also a text hit.
+        group_matches: Dict[int, int] = {}
+        for pk in self.matcher.find(text):
+            for group_id in self._keyword_groups[pk]:
+                group_matches[group_id] = group_matches.get(group_id, 0) + 1
+        
+        # Only matched groups contribute; visiting them in table order keeps
+        # the per-category sums identical to a full scan
+        total_scores: Dict[SupportCategory, float] = {}
+        match_counts: Dict[SupportCategory, int] = {}
+        for group_id in sorted(group_matches):
+            category, group_size, weight = self._groups[group_id]
+            # Score based on match ratio and weight
+            match_ratio = group_matches[group_id] / group_size
+            total_scores[category] = total_scores.get(category, 0.0) + match_ratio * weight
+            match_counts[category] = match_counts.get(category, 0) + 1
+        
+        for category in self.patterns:
+            match_count = match_counts.get(category, 0)
             
             # Normalize score (cap at 1.0)
             if match_count > 0:
+                total_score = total_scores[category]
                 # Use weighted sum instead of average for better scoring
                 # More matches = higher confidence
                 # Boost for multiple pattern matches
@@ -273,13 +400,15 @@ class RuleBasedClassifier:
         if not scores:
             return SupportCategory.GENERAL, 0.3
         
-        best_category = max(scores.items(), key=lambda x: x[1])
+        # First highest score wins ties, as with max over items()
+        best_category = max(scores, key=scores.get)
+        confidence = scores[best_category]
         
         # If all scores are very low, default to GENERAL with low confidence
-        if best_category[1] < 0.2:
+        if confidence < 0.2:
             return SupportCategory.GENERAL, 0.3
         
-        return best_category
+        return best_category, confidence
     
     def _get_matched_patterns(
         self,
@@ -294,19 +423,16 @@ class RuleBasedClassifier:
             keywords: Extracted keywords from query
             
         Returns:
-            List of matched pattern keywords
+            List of matched pattern keywords, in query order without
+            duplicates
         """
-        matched = []
-        
-        if category not in self.patterns:
-            return matched
+        category_keywords = self._category_keywords.get(category)
+        if not category_keywords:
+            return []
         
-        for pattern_keywords, _ in self.patterns[category]:
-            for pk in pattern_keywords:
-                if pk in keywords:
-                    matched.append(pk)
-        
-        return list(set(matched))  # Remove duplicates
+        # One pass over the query's keywords; dict.fromkeys drops repeats
+        # and keeps a stable order for the reasoning text
+        return list(dict.fromkeys([kw for kw in keywords if kw in category_keywords]))
     
     def _detect_multi_intent(
         self,
@@ -334,26 +460,43 @@ class RuleBasedClassifier:
         ]
         
         # Sort by score descending
-        additional.sort(key=lambda c: scores[c], reverse=True)
+        additional.sort(key=scores.get, reverse=True)
         
         is_multi_intent = len(additional) > 0
         
-        logger.debug(
-            "Multi-intent detection",
-            primary=primary_category.value,
-            additional=[c.value for c in additional],
-            is_multi_intent=is_multi_intent
-        )
+        if self._debug_enabled:
+            logger.debug(
+                "Multi-intent detection",
+                primary=primary_category.value,
+                additional=[_CATEGORY_VALUES[c] for c in additional],
+                is_multi_intent=is_multi_intent
+            )
         
         return additional, is_multi_intent
     
+    def _priority_flags_impl(self, query_lower: str) -> Tuple[bool, bool]:
+        """
+        Scan for priority keywords (called via the memoized priority_flags).
+        
+        Args:
+            query_lower: Lowercased original query
+            
+        Returns:
+            (has_critical_keyword, has_high_priority_keyword)
+        """
+        found = self.routing_matcher.find(query_lower)
+        return (
+            not self._critical_keywords.isdisjoint(found),
+            not self._high_keywords.isdisjoint(found)
+        )
+    
     def _determine_routing(
         self,
         category: SupportCategory,
         confidence: float,
         is_multi_intent: bool,
-        query_text: str
-    ) -> Tuple[str, bool]:
+        query_lower: str
+    ) -> Tuple[RoutingPriority, bool]:
         """
         Determine routing priority and if human review is needed.
         
@@ -361,40 +504,23 @@ class RuleBasedClassifier:
             category: Classified category
             confidence: Classification confidence
             is_multi_intent: Whether multiple intents detected
-            query_text: Original query
+            query_lower: Lowercased original query
             
         Returns:
             (routing_priority, requires_human_review)
         """
-        query_lower = query_text.lower()
-        
-        # Emergency/Critical keywords
-        critical_keywords = [
-            'urgent', 'emergency', 'critical', 'asap', 'immediately',
-            'can\'t access', 'cannot access', 'locked out', 'fraud',
-            'unauthorized', 'hacked', 'stolen', 'security breach'
-        ]
-        
-        # High priority keywords
-        high_keywords = [
-            'crash', 'error', 'down', 'not working', 'broken',
-            'charged twice', 'double charge', 'refund', 'money back',
-            'forgot password', 'reset password'
-        ]
-        
-        # Check for critical issues
-        has_critical = any(kw in query_lower for kw in critical_keywords)
-        has_high = any(kw in query_lower for kw in high_keywords)
+        # Check for critical / high priority issues (memoized scan)
+        has_critical, has_high = self.priority_flags(query_lower)
         
         # Determine priority
         if has_critical:
-            priority = "critical"
+            priority = RoutingPriority.CRITICAL
         elif has_high or is_multi_intent:
-            priority = "high"
+            priority = RoutingPriority.HIGH
         elif confidence < 0.5:
-            priority = "high"  # Low confidence needs review
+            priority = RoutingPriority.HIGH  # Low confidence needs review
         else:
-            priority = "normal"
+            priority = RoutingPriority.NORMAL
         
         # Determine if human review needed
         requires_human = (
@@ -404,15 +530,16 @@ class RuleBasedClassifier:
             (category == SupportCategory.BILLING and has_high)  # Billing + refund
         )
         
-        logger.debug(
-            "Routing determination",
-            priority=priority,
-            requires_human=requires_human,
-            is_multi_intent=is_multi_intent,
-            confidence=confidence,
-            has_critical=has_critical,
-            has_high=has_high
-        )
+        if self._debug_enabled:
+            logger.debug(
+                "Routing determination",
+                priority=priority.value,
+                requires_human=requires_human,
+                is_multi_intent=is_multi_intent,
+                confidence=confidence,
+                has_critical=has_critical,
+                has_high=has_high
+            )
         
         return priority, requires_human
 
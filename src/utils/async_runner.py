@@ -0,0 +1,65 @@
+"""
+Background event loop for running async code from sync callers.
+
+Streamlit (and most of this app) is synchronous, but the async Azure
+OpenAI client keeps a connection pool bound to the event loop it was
+first used on. Running every coroutine on one long-lived loop lets that
+pool be reused instead of creating a fresh loop per `asyncio.run()`.
+"""
+
+import asyncio
+import atexit
+import threading
+from functools import lru_cache
+from typing import Awaitable, TypeVar
+
+T = TypeVar("T")
+
+
+@lru_cache()
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared background event loop (started on first use).
+
+    Returns:
+        Event loop running forever in a daemon thread
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(
+        target=loop.run_forever,
+        name="async-runner",
+        daemon=True
+    )
+    thread.start()
+    atexit.register(_shutdown, loop)
+    return loop
+
+
+def _shutdown(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel background tasks (e.g. batch drainers) at interpreter exit."""
+    async def cancel_pending():
+        current = asyncio.current_task()
+        tasks = [t for t in asyncio.all_tasks() if t is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    try:
+        asyncio.run_coroutine_threadsafe(cancel_pending(), loop).result(timeout=1)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """
+    Run a coroutine on the shared loop and block until it finishes.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result (exceptions are re-raised)
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+    return future.result()
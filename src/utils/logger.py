@@ -11,6 +11,9 @@ from loguru import logger
 
 from src.core.config import get_settings
 
+# Lowest level any sink accepts (loguru's default stderr sink takes DEBUG)
+_min_level_no = logger.level("DEBUG").no
+
 
 def setup_logger():
     """
@@ -25,6 +28,8 @@ def setup_logger():
     Call this ONCE at application startup.
     """
     
+    global _min_level_no
+    
     settings = get_settings()
     
     # Remove default handler (Loguru adds one by default)
@@ -82,6 +87,8 @@ def setup_logger():
         
         encoding="utf-8",  # Support special characters
         
+        enqueue=True,  # Write from a background thread, not the caller's
+        
         backtrace=True,
         diagnose=True,
     )
@@ -106,10 +113,13 @@ def setup_logger():
         rotation="00:00",
         retention=f"{settings.log_retention_days * 2} days",  # Keep errors longer
         compression="zip",
+        enqueue=True,
         backtrace=True,
         diagnose=True,
     )
     
+    _min_level_no = min(logger.level(settings.log_level).no, logger.level("ERROR").no)
+    
     logger.info(
         "Logger initialized",
         log_level=settings.log_level,
@@ -134,4 +144,21 @@ def get_logger():
     Note:
         Call setup_logger() once at app startup before using this.
     """
-    return logger
\ No newline at end of file
+    return logger
+
+
+def is_log_enabled(level: str) -> bool:
+    """
+    Check whether any sink would emit messages at this level.
+    
+    Lets hot paths skip building log kwargs (loguru evaluates them even
+    when no sink accepts the level). Check once and keep the result,
+    e.g. in __init__.
+    
+    Args:
+        level: Level name ("DEBUG", "INFO", ...)
+        
+    Returns:
+        True if a message at this level would be logged
+    """
+    return logger.level(level).no >= _min_level_no
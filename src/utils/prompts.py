@@ -5,8 +5,50 @@ This module contains carefully crafted prompts for Azure OpenAI
 to classify support queries accurately.
 """
 
-from typing import List
-from src.core.config import get_settings
+from functools import lru_cache
+from typing import List, Tuple
+
+
+DEFAULT_CATEGORIES = (
+    "Billing & Payments",
+    "Technical Issues",
+    "Account Management",
+    "Product Questions",
+    "Feature Requests",
+    "Bug Reports",
+    "General Inquiry"
+)
+
+# Longer queries are cut before prompting (intent is in the opening text)
+MAX_QUERY_CHARS = 4000
+
+# Shared by the single-query and batch prompts
+CLASSIFICATION_RULES = """CLASSIFICATION GUIDELINES:
+- "Billing & Payments": Money, charges, refunds, subscriptions, invoices, payment methods
+- "Technical Issues": Errors, crashes, bugs, performance problems, things not working
+- "Account Management": Login, password, email, account settings, access issues
+- "Product Questions": How-to questions, feature usage, general product inquiries
+- "Feature Requests": Suggestions for new features or improvements
+- "Bug Reports": Reports of incorrect behavior or unexpected results
+- "General Inquiry": Greetings, general questions, unclear intent
+
+IMPORTANT RULES:
+- Be decisive - choose the PRIMARY category even if multiple could apply
+- Use REALISTIC confidence scores based on query clarity:
+  * 0.95-1.0: Extremely clear with explicit category keywords (rare)
+  * 0.80-0.95: Very clear intent with strong indicators
+  * 0.60-0.80: Clear but could fit multiple categories
+  * 0.40-0.60: Ambiguous or lacks specific details
+  * 0.20-0.40: Very vague or unclear intent
+- Adjust confidence DOWN if the query is short, vague, or could fit multiple categories
+- Never use exactly 0.9 - be more precise (e.g., 0.87, 0.76, 0.62)
+
+SENTIMENT & URGENCY DETECTION:
+- Detect customer emotion: frustrated, confused, angry, polite, urgent
+- Note urgency indicators: "ASAP", "urgent", "immediately", multiple exclamation marks, all caps
+- Include emotion/urgency in reasoning if detected
+
+"""
 
 
 def get_classification_prompt(
@@ -18,27 +60,29 @@ def get_classification_prompt(
     
     Args:
         query: The support query to classify
-        categories: List of valid categories (uses config if None)
+        categories: List of valid categories (uses defaults if None)
         
     Returns:
         Formatted prompt string
     """
-    settings = get_settings()
-    
     if categories is None:
-        categories = [
-            "Billing & Payments",
-            "Technical Issues",
-            "Account Management",
-            "Product Questions",
-            "Feature Requests",
-            "Bug Reports",
-            "General Inquiry"
-        ]
+        categories = DEFAULT_CATEGORIES
     
+    head, tail = _classification_prompt_parts(tuple(categories))
+    return head + query[:MAX_QUERY_CHARS] + tail
+
+
+@lru_cache(maxsize=8)
+def _classification_prompt_parts(categories: Tuple[str, ...]) -> Tuple[str, str]:
+    """
+    Build the prompt text before and after the query.
+    
+    Memoized per category list, so each call only concatenates the query
+    between the two cached parts.
+    """
     categories_list = "\n".join([f"- {cat}" for cat in categories])
     
-    prompt = f"""You are an expert customer support query classifier for a SaaS application.
+    head = f"""You are an expert customer support query classifier for a SaaS application.
 
 Your task is to analyze the following customer support query and classify it into ONE category.
 
@@ -46,7 +90,9 @@ AVAILABLE CATEGORIES:
 {categories_list}
 
 CUSTOMER QUERY:
-"{query}"
+\""""
+    
+    tail = f"""\"
 
 INSTRUCTIONS:
 1. Read the query carefully and understand the customer's primary intent
@@ -54,32 +100,7 @@ INSTRUCTIONS:
 3. Provide a confidence score between 0.0 and 1.0
 4. Explain your reasoning in ONE concise sentence (max 100 characters)
 
-CLASSIFICATION GUIDELINES:
-- "Billing & Payments": Money, charges, refunds, subscriptions, invoices, payment methods
-- "Technical Issues": Errors, crashes, bugs, performance problems, things not working
-- "Account Management": Login, password, email, account settings, access issues
-- "Product Questions": How-to questions, feature usage, general product inquiries
-- "Feature Requests": Suggestions for new features or improvements
-- "Bug Reports": Reports of incorrect behavior or unexpected results
-- "General Inquiry": Greetings, general questions, unclear intent
-
-IMPORTANT RULES:
-- Be decisive - choose the PRIMARY category even if multiple could apply
-- Use REALISTIC confidence scores based on query clarity:
-  * 0.95-1.0: Extremely clear with explicit category keywords (rare)
-  * 0.80-0.95: Very clear intent with strong indicators
-  * 0.60-0.80: Clear but could fit multiple categories
-  * 0.40-0.60: Ambiguous or lacks specific details
-  * 0.20-0.40: Very vague or unclear intent
-- Adjust confidence DOWN if the query is short, vague, or could fit multiple categories
-- Never use exactly 0.9 - be more precise (e.g., 0.87, 0.76, 0.62)
-
-SENTIMENT & URGENCY DETECTION:
-- Detect customer emotion: frustrated, confused, angry, polite, urgent
-- Note urgency indicators: "ASAP", "urgent", "immediately", multiple exclamation marks, all caps
-- Include emotion/urgency in reasoning if detected
-
-OUTPUT FORMAT (respond ONLY with valid JSON, no additional text):
+{CLASSIFICATION_RULES}OUTPUT FORMAT (respond ONLY with valid JSON, no additional text):
 {{
     "category": "Selected Category Name",
     "confidence": 0.75,
@@ -90,7 +111,67 @@ OUTPUT FORMAT (respond ONLY with valid JSON, no additional text):
 
 Respond now with ONLY the JSON object:"""
     
-    return prompt
+    return head, tail
+
+
+def get_batch_classification_prompt(
+    queries: List[str],
+    categories: List[str] = None
+) -> str:
+    """
+    Generate one prompt that classifies several queries at once.
+    
+    Same categories and rules as get_classification_prompt(); the model
+    returns one result per query, in order, under a "results" key.
+    
+    Args:
+        queries: Support queries to classify
+        categories: List of valid categories (uses defaults if None)
+        
+    Returns:
+        Formatted prompt string
+    """
+    if categories is None:
+        categories = DEFAULT_CATEGORIES
+    
+    categories_list = "\n".join([f"- {cat}" for cat in categories])
+    queries_list = "\n".join(
+        f'{i}. "{query[:MAX_QUERY_CHARS]}"' for i, query in enumerate(queries, start=1)
+    )
+    
+    return f"""You are an expert customer support query classifier for a SaaS application.
+
+Your task is to analyze each of the following {len(queries)} customer support queries independently and classify each into ONE category.
+
+AVAILABLE CATEGORIES:
+{categories_list}
+
+CUSTOMER QUERIES:
+{queries_list}
+
+INSTRUCTIONS:
+1. Read each query carefully and understand the customer's primary intent
+2. Choose the MOST relevant category from the list above
+3. Provide a confidence score between 0.0 and 1.0
+4. Explain your reasoning in ONE concise sentence (max 100 characters)
+
+{CLASSIFICATION_RULES}OUTPUT FORMAT (respond ONLY with valid JSON, no additional text):
+{{
+    "results": [
+        {{
+            "id": 1,
+            "category": "Selected Category Name",
+            "confidence": 0.75,
+            "reasoning": "Brief explanation why this category",
+            "sentiment": "frustrated",
+            "urgency": "high"
+        }}
+    ]
+}}
+
+Return exactly {len(queries)} results, one per query, in the same order as the numbered list.
+
+Respond now with ONLY the JSON object:"""
 
 
 def get_validation_prompt(query: str, suggested_category: str) -> str:
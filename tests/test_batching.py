@@ -0,0 +1,89 @@
+"""
+Tests for dynamic micro-batching.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.batching import BatchQueue
+from src.utils.async_runner import run_sync
+
+
+class TestBatchQueue:
+    """Test batch formation and result routing."""
+    
+    def make_queue(self, max_batch=4, max_wait_ms=50):
+        """Queue whose handler upper-cases items and records batch sizes."""
+        self.batches = []
+        
+        async def handler(items):
+            self.batches.append(list(items))
+            return [item.upper() for item in items]
+        
+        return BatchQueue(handler, max_batch=max_batch, max_wait_ms=max_wait_ms)
+    
+    def test_concurrent_submissions_share_a_batch(self):
+        """Items submitted together are handled in one call, in order."""
+        queue = self.make_queue(max_batch=8)
+        
+        async def main():
+            return await asyncio.gather(*(queue.submit(x) for x in "abc"))
+        
+        assert run_sync(main()) == ["A", "B", "C"]
+        assert self.batches == [["a", "b", "c"]]
+    
+    def test_max_batch_splits(self):
+        """Batches never exceed max_batch."""
+        queue = self.make_queue(max_batch=2)
+        
+        async def main():
+            return await asyncio.gather(*(queue.submit(x) for x in "abcde"))
+        
+        assert run_sync(main()) == ["A", "B", "C", "D", "E"]
+        assert [len(b) for b in self.batches] == [2, 2, 1]
+    
+    def test_submit_from_other_loop_and_threads(self):
+        """Sync callers in several threads are batched together."""
+        queue = self.make_queue(max_batch=8, max_wait_ms=200)
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda x: asyncio.run(queue.submit(x)), "wxyz"))
+        
+        assert results == ["W", "X", "Y", "Z"]
+        assert sum(len(b) for b in self.batches) == 4
+        assert len(self.batches) < 4
+    
+    def test_handler_error_propagates(self):
+        """Handler failures are raised to every caller in the batch."""
+        async def handler(items):
+            raise RuntimeError("boom")
+        
+        queue = BatchQueue(handler, max_batch=4, max_wait_ms=10)
+        
+        async def main():
+            return await asyncio.gather(
+                *(queue.submit(x) for x in "ab"),
+                return_exceptions=True
+            )
+        
+        results = run_sync(main())
+        assert all(isinstance(r, RuntimeError) for r in results)
+    
+    def test_batches_overlap_up_to_max_inflight(self):
+        """Slow batches run concurrently, bounded by max_inflight."""
+        state = {"active": 0, "peak": 0}
+        
+        async def handler(items):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.05)
+            state["active"] -= 1
+            return [item.upper() for item in items]
+        
+        queue = BatchQueue(handler, max_batch=1, max_wait_ms=1, max_inflight=2)
+        
+        async def main():
+            return await asyncio.gather(*(queue.submit(x) for x in "abcde"))
+        
+        assert run_sync(main()) == ["A", "B", "C", "D", "E"]
+        assert state["peak"] == 2
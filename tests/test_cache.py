@@ -0,0 +1,135 @@
+"""
+Tests for the LLM result cache.
+"""
+
+import numpy as np
+from src.core.cache import ResultCache, SemanticCache, normalize_cache_key
+from src.core.models import (
+    ClassificationResult,
+    ClassificationMethod,
+    SupportCategory
+)
+
+
+def make_result(category=SupportCategory.BILLING):
+    """Build a minimal LLM result."""
+    return ClassificationResult(
+        category=category,
+        confidence=0.9,
+        method=ClassificationMethod.LLM_FALLBACK,
+        reasoning="test",
+        response_time_ms=500.0,
+        llm_tokens_used=120,
+        estimated_cost=0.00005
+    )
+
+
+class TestResultCache:
+    """Test LRU + TTL behaviour."""
+    
+    def test_key_normalization(self):
+        """Case and whitespace differences share a key."""
+        assert normalize_cache_key("  Refund   MY\tOrder \n") == "refund my order"
+    
+    def test_hit_after_put(self):
+        """Normalized repeats are served from cache."""
+        cache = ResultCache(maxsize=10, ttl_seconds=60)
+        result = make_result()
+        cache.put("Refund my order", result)
+        
+        assert cache.get("refund  my ORDER") is result
+        assert cache.hits == 1
+    
+    def test_miss(self):
+        """Unknown queries miss."""
+        cache = ResultCache(maxsize=10, ttl_seconds=60)
+        assert cache.get("anything") is None
+        assert cache.misses == 1
+    
+    def test_lru_eviction(self):
+        """Least recently used entry is evicted first."""
+        cache = ResultCache(maxsize=2, ttl_seconds=60)
+        cache.put("a", make_result())
+        cache.put("b", make_result())
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", make_result())
+        
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert len(cache) == 2
+    
+    def test_expiry(self, monkeypatch):
+        """Entries expire after the TTL."""
+        import src.core.cache as cache_module
+        
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        
+        cache = ResultCache(maxsize=10, ttl_seconds=60)
+        cache.put("a", make_result())
+        now[0] += 61
+        
+        assert cache.get("a") is None
+        assert len(cache) == 0
+    
+    def test_disabled(self):
+        """maxsize=0 disables caching."""
+        cache = ResultCache(maxsize=0, ttl_seconds=60)
+        cache.put("a", make_result())
+        assert cache.get("a") is None
+
+
+class TestSemanticCache:
+    """Test embedding similarity lookups."""
+    
+    def test_similar_vector_hits(self):
+        """Near-duplicate embeddings return the cached result."""
+        cache = SemanticCache(maxsize=10, threshold=0.92)
+        result = make_result()
+        cache.put([1.0, 0.0, 0.0], result)
+        
+        assert cache.get([0.99, 0.05, 0.0]) is result
+    
+    def test_dissimilar_vector_misses(self):
+        """Unrelated embeddings miss."""
+        cache = SemanticCache(maxsize=10, threshold=0.92)
+        cache.put([1.0, 0.0, 0.0], make_result())
+        
+        assert cache.get([0.0, 1.0, 0.0]) is None
+        assert cache.misses == 1
+    
+    def test_best_match_wins(self):
+        """The most similar entry is returned."""
+        cache = SemanticCache(maxsize=10, threshold=0.5)
+        billing = make_result(SupportCategory.BILLING)
+        technical = make_result(SupportCategory.TECHNICAL)
+        cache.put([1.0, 0.2, 0.0], billing)
+        cache.put([0.2, 1.0, 0.0], technical)
+        
+        assert cache.get([0.1, 1.0, 0.0]) is technical
+    
+    def test_oldest_overwritten_when_full(self):
+        """Full caches overwrite their oldest entry."""
+        cache = SemanticCache(maxsize=2, threshold=0.99)
+        cache.put([1.0, 0.0, 0.0], make_result())
+        cache.put([0.0, 1.0, 0.0], make_result())
+        cache.put([0.0, 0.0, 1.0], make_result())
+        
+        assert len(cache) == 2
+        assert cache.get([1.0, 0.0, 0.0]) is None
+        assert cache.get([0.0, 0.0, 1.0]) is not None
+    
+    def test_projection_preserves_hits(self):
+        """Lookups still work after the PCA projection kicks in."""
+        rng = np.random.default_rng(0)
+        cache = SemanticCache(maxsize=100, threshold=0.92, pca_dims=8, pca_min_entries=20)
+        
+        vectors = rng.normal(size=(30, 32))
+        results = [make_result() for _ in vectors]
+        for vector, result in zip(vectors, results):
+            cache.put(vector, result)
+        
+        assert cache._vectors.shape[1] == 8
+        for vector, result in zip(vectors, results):
+            assert cache.get(vector) is result
@@ -0,0 +1,65 @@
+"""
+Tests for hybrid classifier escalation decisions.
+"""
+
+from src.core.classifier import get_classifier
+from src.core.models import (
+    ClassificationResult,
+    ClassificationMethod,
+    SupportCategory
+)
+
+
+def make_rule_result(confidence, scores):
+    """Build a rule-based result with the given category scores."""
+    return ClassificationResult(
+        category=SupportCategory.BILLING,
+        confidence=confidence,
+        method=ClassificationMethod.RULE_BASED,
+        reasoning="test",
+        response_time_ms=1.0,
+        category_scores=scores
+    )
+
+
+class TestEscalationDecision:
+    """Test when rule results are escalated to the LLM."""
+    
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.classifier = get_classifier()
+        self.threshold = self.classifier.settings.confidence_threshold
+        self.margin = self.classifier.settings.escalation_margin
+        self.gap = self.classifier.settings.ambiguity_gap
+    
+    def test_above_threshold_not_escalated(self):
+        """Confident rule results are kept."""
+        result = make_rule_result(self.threshold, {"a": self.threshold, "b": self.threshold})
+        assert self.classifier._needs_llm(result) == False
+    
+    def test_near_threshold_clear_winner_not_escalated(self):
+        """Just-below-threshold results with a clear winner skip the LLM."""
+        confidence = self.threshold - self.margin / 2
+        result = make_rule_result(confidence, {"a": confidence, "b": 0.0})
+        assert self.classifier._needs_llm(result) == False
+    
+    def test_near_threshold_ambiguous_escalated(self):
+        """Just-below-threshold results with close runners-up escalate."""
+        confidence = self.threshold - self.margin / 2
+        result = make_rule_result(
+            confidence,
+            {"a": confidence, "b": confidence - self.gap / 2}
+        )
+        assert self.classifier._needs_llm(result) == True
+    
+    def test_far_below_threshold_escalated(self):
+        """Low-confidence results always escalate."""
+        confidence = self.threshold - self.margin - 0.05
+        result = make_rule_result(confidence, {"a": confidence, "b": 0.0})
+        assert self.classifier._needs_llm(result) == True
+    
+    def test_missing_scores_treated_as_ambiguous(self):
+        """Without category scores the query escalates."""
+        confidence = self.threshold - self.margin / 2
+        result = make_rule_result(confidence, None)
+        assert self.classifier._needs_llm(result) == True
@@ -0,0 +1,43 @@
+"""
+Tests for multi-pattern keyword matching.
+"""
+
+import pytest
+
+import src.core.keyword_matcher as keyword_matcher
+from src.core.keyword_matcher import KeywordMatcher
+
+
+KEYWORDS = ['charge', 'charged', 'charged twice', 'password', 'forgot my password', 'app']
+
+
+@pytest.fixture(params=["default", "substring"])
+def matcher(request, monkeypatch):
+    """Matcher on the installed backend and on the pure-Python fallback."""
+    if request.param == "substring":
+        monkeypatch.setattr(keyword_matcher, "ahocorasick", None)
+    return KeywordMatcher(KEYWORDS)
+
+
+def test_matcher_finds_overlapping_keywords(matcher):
+    """Test that nested/overlapping keywords are all reported."""
+    found = matcher.find("i was charged twice and forgot my password")
+    
+    assert found == {'charge', 'charged', 'charged twice', 'password', 'forgot my password'}
+
+
+def test_matcher_matches_substrings(matcher):
+    """Test that matching follows `keyword in text` (no word boundaries)."""
+    assert 'app' in matcher.find("this happens every time")
+
+
+def test_matcher_no_matches(matcher):
+    """Test text without any keyword."""
+    assert matcher.find("hello there") == frozenset()
+
+
+def test_matcher_deduplicates_keywords():
+    """Test that duplicate keywords are stored once."""
+    matcher = KeywordMatcher(['refund', 'refund', 'bill'])
+    
+    assert matcher.keywords == ('refund', 'bill')
@@ -0,0 +1,503 @@
+"""
+Tests for LLM classifier helpers and response parsing (no API calls).
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.llm_classifier import (
+    get_llm_classifier,
+    _retry_delay,
+    RETRY_BASE_SECONDS,
+    RETRY_CAP_SECONDS,
+    CLASSIFICATION_MAX_TOKENS,
+    _StreamedJSON
+)
+from src.core.models import ClassificationResult, SupportCategory
+from src.utils.async_runner import run_sync
+from src.utils.prompts import get_classification_prompt, MAX_QUERY_CHARS
+
+
+class FakeAPIError(Exception):
+    """Exception shaped like openai.APIStatusError (response.headers)."""
+    
+    def __init__(self, headers):
+        super().__init__("rate limited")
+        self.response = SimpleNamespace(status_code=429, headers=headers)
+
+
+def make_rate_limit_error(headers=None):
+    """Build an API error carrying the given response headers."""
+    return FakeAPIError(headers or {})
+
+
+class TestRetryDelay:
+    """Test retry backoff selection."""
+    
+    def test_first_retry_is_short(self):
+        """First wait starts near the base, not at seconds."""
+        for _ in range(100):
+            wait = _retry_delay(make_rate_limit_error(), None)
+            assert RETRY_BASE_SECONDS <= wait <= RETRY_BASE_SECONDS * 3
+    
+    def test_waits_are_capped(self):
+        """Waits never exceed the cap, however many retries."""
+        wait = None
+        for _ in range(50):
+            wait = _retry_delay(make_rate_limit_error(), wait)
+            assert RETRY_BASE_SECONDS <= wait <= RETRY_CAP_SECONDS
+    
+    def test_waits_are_jittered(self):
+        """Concurrent retries don't all pick the same wait."""
+        waits = {_retry_delay(make_rate_limit_error(), 1.0) for _ in range(20)}
+        assert len(waits) > 1
+    
+    def test_retry_after_header_respected(self):
+        """Retry-After (seconds) overrides the jittered wait."""
+        error = make_rate_limit_error({"retry-after": "7"})
+        assert _retry_delay(error, None) == 7.0
+    
+    def test_retry_after_ms_header_respected(self):
+        """retry-after-ms takes precedence and is converted to seconds."""
+        error = make_rate_limit_error({"retry-after-ms": "250", "retry-after": "1"})
+        assert _retry_delay(error, None) == 0.25
+    
+    def test_errors_without_response(self):
+        """Timeouts (no response) fall back to jitter."""
+        error = TimeoutError("timed out")
+        assert RETRY_BASE_SECONDS <= _retry_delay(error, None) <= RETRY_CAP_SECONDS
+
+
+def make_response(content, total_tokens=100):
+    """Build an object shaped like a chat completion response."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(total_tokens=total_tokens)
+    )
+
+
+class TestParseResponse:
+    """Test parsing of LLM JSON output."""
+    
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.classifier = get_llm_classifier()
+    
+    @pytest.mark.parametrize("label", [
+        "Billing & Payments",
+        "billing & payments",
+        "  Billing & Payments ",
+        "billing",
+    ])
+    def test_category_variants(self, label):
+        """Exact, lowercased and short category labels are accepted."""
+        content = f'{{"category": "{label}", "confidence": 0.8, "reasoning": "r"}}'
+        result = self.classifier._parse_response(make_response(content), "q", 0.0)
+        assert result.category == SupportCategory.BILLING
+    
+    @pytest.mark.parametrize("label", ['"Shipping"', 'null', '["Billing & Payments"]'])
+    def test_unknown_category_falls_back_to_general(self, label):
+        """Unknown or non-string labels map to General Inquiry."""
+        content = f'{{"category": {label}, "confidence": 0.8, "reasoning": "r"}}'
+        result = self.classifier._parse_response(make_response(content), "q", 0.0)
+        assert result.category == SupportCategory.GENERAL
+        assert result.llm_tokens_used == 100
+    
+    def test_batch_entries_matched_by_id(self):
+        """Batch entries map to queries by id, whatever their order."""
+        content = (
+            '{"results": ['
+            '{"id": 2, "category": "Technical Issues", "confidence": 0.8, "reasoning": "b"},'
+            '{"id": 1, "category": "Bug Reports", "confidence": 0.7, "reasoning": "a"}'
+            ']}'
+        )
+        response = make_response(content, total_tokens=300)
+        first, second = self.classifier._parse_batch_response(response, ["q1", "q2"], 0.0)
+        
+        assert first.category == SupportCategory.BUG
+        assert second.category == SupportCategory.TECHNICAL
+        assert second.llm_tokens_used == 150
+    
+    @pytest.mark.parametrize("ids", [[1, 3], [1, 1], [1, None]])
+    def test_batch_unmatched_ids_left_unset(self, ids):
+        """Missing, duplicated or absent ids never borrow another entry."""
+        content = json.dumps({"results": [
+            {"id": entry_id, "category": "Bug Reports", "confidence": 0.7, "reasoning": "r"}
+            for entry_id in ids
+        ]})
+        response = make_response(content, total_tokens=300)
+        results = self.classifier._parse_batch_response(response, ["q1", "q2"], 0.0)
+        
+        assert results[1] is None
+        assert (results[0] is None) == (ids == [1, 1])
+    
+    def test_schema_output(self):
+        """Schema-conforming output is parsed, with sentiment in reasoning."""
+        content = json.dumps({
+            "category": "Account Management",
+            "confidence": 0.81,
+            "reasoning": "Login problem",
+            "sentiment": "frustrated",
+            "urgency": "high"
+        })
+        result = self.classifier._parse_response(make_response(content), "q", 0.0)
+        
+        assert result.category == SupportCategory.ACCOUNT
+        assert result.confidence == 0.81
+        assert result.reasoning == "Login problem [Sentiment: frustrated, Urgency: high]"
+    
+    def test_schema_batch_output(self):
+        """Schema-conforming batch output is matched by id like plain JSON."""
+        item = {"confidence": 0.8, "reasoning": "r", "sentiment": "neutral", "urgency": "normal"}
+        content = json.dumps({"results": [
+            {"id": 2, "category": "Feature Requests", **item},
+            {"id": 1, "category": "Bug Reports", **item},
+        ]})
+        response = make_response(content, total_tokens=300)
+        first, second = self.classifier._parse_batch_response(response, ["q1", "q2"], 0.0)
+        
+        assert first.category == SupportCategory.BUG
+        assert second.category == SupportCategory.FEATURE
+        assert second.llm_tokens_used == 150
+    
+    def test_batch_missing_entry_classified_singly(self, monkeypatch):
+        """A query the batch response skipped gets its own request."""
+        content = json.dumps({"results": [
+            {"id": 3, "category": "Bug Reports", "confidence": 0.7, "reasoning": "r"},
+            {"id": 1, "category": "Feature Requests", "confidence": 0.7, "reasoning": "r"},
+        ]})
+        single_calls = []
+        
+        async def fake_acall_llm(prompt, max_tokens=None, response_format=None):
+            return make_response(content, total_tokens=300)
+        
+        async def fake_aclassify_uncached(query_text, start_time, max_retries=3):
+            single_calls.append(query_text)
+            return self.classifier._create_fallback_result(query_text, start_time, "single")
+        
+        monkeypatch.setattr(self.classifier, "_acall_llm", fake_acall_llm)
+        monkeypatch.setattr(self.classifier, "_aclassify_uncached", fake_aclassify_uncached)
+        
+        results = run_sync(self.classifier._aclassify_batch(["q1", "q2", "q3"]))
+        
+        assert single_calls == ["q2"]
+        assert results[0].category == SupportCategory.FEATURE
+        assert results[1].reasoning == "LLM classification failed: single"
+        assert results[2].category == SupportCategory.BUG
+    
+    def test_request_uses_strict_schema(self):
+        """Requests carry a strict JSON schema when structured output is on."""
+        response_format = self.classifier._request_kwargs("prompt")["response_format"]
+        
+        if self.classifier.structured_output:
+            assert response_format["type"] == "json_schema"
+            assert response_format["json_schema"]["strict"] is True
+        else:
+            assert response_format == {"type": "json_object"}
+    
+    def test_out_of_range_values_clamped(self):
+        """LLM values outside the model's constraints are clamped."""
+        long_reasoning = "x" * 600
+        content = (
+            '{"category": "Bug Reports", "confidence": 1.7, '
+            f'"reasoning": "{long_reasoning}"}}'
+        )
+        result = self.classifier._parse_response(make_response(content), "q", 0.0)
+        
+        assert result.confidence == 0.95
+        assert len(result.reasoning) == 500
+        
+        content = '{"category": "Bug Reports", "confidence": -0.2, "reasoning": ""}'
+        result = self.classifier._parse_response(make_response(content), "q", 0.0)
+        
+        assert result.confidence == 0.0
+        assert result.reasoning == "LLM classification"
+    
+    def test_confidence_rounded(self):
+        """Confidence is rounded to 2 places like the validator would."""
+        content = '{"category": "Bug Reports", "confidence": 0.87654, "reasoning": "r"}'
+        result = self.classifier._parse_response(make_response(content), "q", 0.0)
+        
+        assert result.confidence == 0.88
+        assert result.timestamp.tzinfo is not None
+    
+    def test_fallback_result_valid(self):
+        """Fallback results satisfy the model's constraints."""
+        result = self.classifier._create_fallback_result("q", 0.0, "e" * 1000)
+        
+        ClassificationResult.model_validate(result.model_dump())
+        assert result.category == SupportCategory.GENERAL
+
+
+class TestClassifyMany:
+    """Test bounded concurrent classification (no API calls)."""
+    
+    def test_concurrency_bounded_and_order_kept(self, monkeypatch):
+        """No more than max_concurrency calls run at once; order is kept."""
+        classifier = get_llm_classifier()
+        state = {"active": 0, "peak": 0}
+        
+        async def fake_classify_async(query_text, max_retries=3):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return query_text
+        
+        monkeypatch.setattr(classifier, "classify_async", fake_classify_async)
+        
+        queries = [f"query {i}" for i in range(20)]
+        results = run_sync(classifier.classify_many(queries, max_concurrency=3))
+        
+        assert results == queries
+        assert state["peak"] == 3
+
+
+COMPLETION_BODY = json.dumps({
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o-mini",
+    "choices": [{
+        "index": 0,
+        "finish_reason": "stop",
+        "message": {"role": "assistant", "content": "{}"}
+    }],
+    "usage": {"prompt_tokens": 9, "completion_tokens": 1, "total_tokens": 10}
+}).encode("utf-8")
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every POST with a chat completion over a kept-alive connection."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(COMPLETION_BODY)))
+        self.end_headers()
+        self.wfile.write(COMPLETION_BODY)
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_endpoint():
+    """URL of a local HTTP server standing in for Azure OpenAI."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestAsyncClients:
+    """Test that async clients are kept per event loop."""
+    
+    def test_client_reused_within_a_loop(self):
+        """One loop reuses its client; another loop gets its own."""
+        classifier = get_llm_classifier()
+        
+        async def clients():
+            return classifier.aclient, classifier.aclient
+        
+        first, again = asyncio.run(clients())
+        second, _ = asyncio.run(clients())
+        
+        assert first is again
+        assert first is not second
+    
+    def test_calls_from_successive_asyncio_runs(self, monkeypatch, local_endpoint):
+        """Pooled connections from a closed loop are never reused."""
+        classifier = get_llm_classifier()
+        options = dict(classifier._aclient_options, azure_endpoint=local_endpoint)
+        monkeypatch.setattr(classifier, "_aclient_options", options)
+        monkeypatch.setattr(classifier, "_aclients", type(classifier._aclients)())
+        
+        async def call():
+            return await classifier._acall_llm("p", response_format=classifier._response_format)
+        
+        assert asyncio.run(call()).usage.total_tokens == 10
+        assert asyncio.run(call()).usage.total_tokens == 10
+
+
+class FakeBatchClient:
+    """Minimal stand-in for the files/batches endpoints of the client."""
+    
+    def __init__(self, output_lines):
+        self.output = "\n".join(
+            line if isinstance(line, str) else json.dumps(line) for line in output_lines
+        )
+        self.uploaded = None
+        self.polls = 0
+        self.files = SimpleNamespace(create=self._upload, content=self._content)
+        self.batches = SimpleNamespace(create=self._create, retrieve=self._retrieve)
+    
+    def _upload(self, file, purpose):
+        self.uploaded = file[1].decode("utf-8").splitlines()
+        return SimpleNamespace(id="file-in")
+    
+    def _content(self, file_id):
+        return SimpleNamespace(text=self.output)
+    
+    def _create(self, input_file_id, endpoint, completion_window):
+        return SimpleNamespace(id="batch-1", status="validating", output_file_id=None)
+    
+    def _retrieve(self, batch_id):
+        self.polls += 1
+        return SimpleNamespace(id=batch_id, status="completed", output_file_id="file-out")
+
+
+def batch_output_line(custom_id, category):
+    """One successful line of a Batch API output file."""
+    content = json.dumps({"category": category, "confidence": 0.8, "reasoning": "r"})
+    return {
+        "custom_id": custom_id,
+        "response": {
+            "status_code": 200,
+            "body": {
+                "id": "chatcmpl-1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o-mini",
+                "choices": [{
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": content}
+                }],
+                "usage": {"prompt_tokens": 90, "completion_tokens": 10, "total_tokens": 100}
+            }
+        }
+    }
+
+
+class TestClassifyBatchOffline:
+    """Test Batch API job submission and result mapping (fake client)."""
+    
+    def test_results_mapped_by_custom_id(self, monkeypatch):
+        """Output lines (in any order) map back to their queries."""
+        classifier = get_llm_classifier()
+        fake = FakeBatchClient([
+            batch_output_line("q1", "Bug Reports"),
+            batch_output_line("q0", "Billing & Payments"),
+        ])
+        monkeypatch.setattr(classifier, "client", fake)
+        
+        queries = ["offline billing query", "offline bug query", "offline lost query"]
+        results = classifier.classify_batch_offline(queries, poll_interval=0)
+        
+        assert len(fake.uploaded) == 3
+        request = json.loads(fake.uploaded[0])
+        assert request["custom_id"] == "q0"
+        assert request["url"] == "/chat/completions"
+        assert request["body"]["model"] == classifier.batch_deployment
+        
+        assert results[0].category == SupportCategory.BILLING
+        assert results[1].category == SupportCategory.BUG
+        assert results[0].llm_tokens_used == 100
+        
+        # Missing from the output file: fallback, not cached
+        assert results[2].llm_tokens_used is None
+        assert classifier.cache.get(queries[2]) is None
+        assert classifier.cache.get(queries[0]) is not None
+    
+    def test_unreadable_records_skipped(self, monkeypatch):
+        """Corrupt lines and bad custom_ids fall back without sinking the job."""
+        classifier = get_llm_classifier()
+        fake = FakeBatchClient([
+            '{"custom_id": "q0", "respo',
+            batch_output_line("q9", "Bug Reports"),
+            batch_output_line("x", "Bug Reports"),
+            batch_output_line("q1", "Feature Requests"),
+        ])
+        monkeypatch.setattr(classifier, "client", fake)
+        
+        queries = ["offline corrupt query", "offline feature query"]
+        results = classifier.classify_batch_offline(queries, poll_interval=0)
+        
+        assert results[0].reasoning == "LLM classification failed: Missing from batch output"
+        assert results[1].category == SupportCategory.FEATURE
+
+
+class TestTokenBudget:
+    """Test request size limits."""
+    
+    def test_max_tokens_capped(self):
+        """Completion budget never exceeds the classification cap."""
+        classifier = get_llm_classifier()
+        kwargs = classifier._request_kwargs("prompt")
+        
+        assert kwargs["max_tokens"] <= CLASSIFICATION_MAX_TOKENS
+    
+    def test_long_query_truncated(self):
+        """Oversized queries are cut before they reach the prompt."""
+        prompt = get_classification_prompt("a" * (MAX_QUERY_CHARS + 1000))
+        
+        assert "a" * MAX_QUERY_CHARS in prompt
+        assert "a" * (MAX_QUERY_CHARS + 1) not in prompt
+    
+    def test_query_inserted_verbatim(self):
+        """Braces and quotes in the query reach the prompt unchanged."""
+        query = 'Charged {twice} for "Pro" plan'
+        prompt = get_classification_prompt(query)
+        
+        assert f'CUSTOMER QUERY:\n"{query}"\n' in prompt
+        assert prompt.count(query) == 1
+
+
+class FakeStream:
+    """Iterable of streamed chunks that records being closed."""
+    
+    def __init__(self, deltas):
+        self.chunks = [
+            SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=SimpleNamespace(content=d))])
+            for d in deltas
+        ]
+        self.closed = False
+        self.read = 0
+    
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+    
+    def close(self):
+        self.closed = True
+
+
+class TestStreaming:
+    """Test streamed responses cut at the end of the JSON object."""
+    
+    def test_collector_ignores_braces_in_strings(self):
+        """Braces inside string values do not end the object."""
+        collector = _StreamedJSON()
+        
+        assert not collector.feed('{"reasoning": "uses {curly} and \\"quotes}\\"",')
+        assert collector.feed(' "confidence": 0.8}')
+        
+        parsed = json.loads("".join(collector.parts))
+        assert parsed["confidence"] == 0.8
+    
+    def test_stream_stops_at_closing_brace(self, monkeypatch):
+        """Reading stops after the object closes and usage is estimated."""
+        classifier = get_llm_classifier()
+        stream = FakeStream(['{"category": "Bug Reports",', ' "confidence": 0.8}', "\n", "\n"])
+        fake_client = SimpleNamespace(chat=SimpleNamespace(
+            completions=SimpleNamespace(create=lambda **kwargs: stream)
+        ))
+        monkeypatch.setattr(classifier, "client", fake_client)
+        
+        response = classifier._call_llm_streaming("p" * 400)
+        
+        assert stream.closed
+        assert stream.read == 2
+        assert json.loads(response.choices[0].message.content)["category"] == "Bug Reports"
+        assert response.usage.total_tokens == 100 + 2
@@ -11,6 +11,7 @@ from src.core.models import (
     ClassificationResult,
     SupportCategory,
     ClassificationMethod,
+    RoutingPriority,
     SessionMetrics,
     create_classification_result
 )
@@ -69,6 +70,15 @@ def test_query_input_empty_after_strip():
     assert any(err['type'] == 'string_too_short' for err in errors)
 
 
+@pytest.mark.parametrize("text", ["12345 678", "!!!???", "½½½½½ ²²"])
+def test_query_input_requires_letters(text):
+    """Test that queries without any letters are rejected."""
+    with pytest.raises(ValidationError) as exc_info:
+        QueryInput(query_text=text)
+    
+    assert "at least some text" in str(exc_info.value)
+
+
 # ============================================================================
 # ClassificationResult Tests
 # ============================================================================
@@ -87,6 +97,7 @@ def test_classification_result_valid():
     assert result.confidence == 0.85
     assert result.method == ClassificationMethod.RULE_BASED
     assert isinstance(result.timestamp, datetime)
+    assert result.timestamp.utcoffset().total_seconds() == 0
 
 
 def test_classification_result_confidence_bounds():
@@ -112,6 +123,22 @@ def test_classification_result_confidence_bounds():
         )
 
 
+def test_classification_result_routing_priority_enum():
+    """Test that routing priority strings become RoutingPriority members."""
+    result = ClassificationResult(
+        category=SupportCategory.BILLING,
+        confidence=0.85,
+        method=ClassificationMethod.RULE_BASED,
+        reasoning="Test",
+        response_time_ms=10.0,
+        routing_priority="critical"
+    )
+    
+    assert result.routing_priority is RoutingPriority.CRITICAL
+    assert result.routing_priority == "critical"
+    assert result.model_dump(mode="json")["routing_priority"] == "critical"
+
+
 def test_classification_result_confidence_rounding():
     """Test that confidence is rounded to 2 decimal places."""
     result = ClassificationResult(
@@ -200,6 +227,58 @@ def test_session_metrics_division_by_zero():
     assert metrics.average_cost_per_query() == 0.0
 
 
+def test_session_metrics_record():
+    """Test incremental aggregation of classification results."""
+    metrics = SessionMetrics()
+    
+    metrics.record(ClassificationResult(
+        category=SupportCategory.BILLING,
+        confidence=0.9,
+        method=ClassificationMethod.RULE_BASED,
+        reasoning="Rules",
+        response_time_ms=10.0
+    ))
+    metrics.record(ClassificationResult(
+        category=SupportCategory.BILLING,
+        confidence=0.7,
+        method=ClassificationMethod.LLM_FALLBACK,
+        reasoning="LLM",
+        response_time_ms=30.0,
+        llm_tokens_used=100,
+        estimated_cost=0.002
+    ))
+    
+    assert metrics.total_queries == 2
+    assert metrics.rule_based_count == 1
+    assert metrics.llm_fallback_count == 1
+    assert metrics.average_confidence == pytest.approx(0.8)
+    assert metrics.average_response_time_ms == pytest.approx(20.0)
+    assert metrics.total_tokens_used == 100
+    assert metrics.estimated_total_cost == pytest.approx(0.002)
+    assert metrics.category_distribution == {"Billing & Payments": 2}
+    assert metrics.method_distribution == {"rule-based": 1, "llm-fallback": 1}
+
+
+def test_session_metrics_distribution_from_dict():
+    """Test that a provided distribution dict becomes a Counter."""
+    metrics = SessionMetrics(category_distribution={"Bug Reports": 2})
+    
+    metrics.record(ClassificationResult(
+        category=SupportCategory.BILLING,
+        confidence=0.9,
+        method=ClassificationMethod.RULE_BASED,
+        reasoning="Rules",
+        response_time_ms=10.0
+    ))
+    
+    assert metrics.category_distribution.most_common(1) == [("Bug Reports", 2)]
+    assert metrics.category_distribution["Billing & Payments"] == 1
+    assert metrics.model_dump(mode="json")["category_distribution"] == {
+        "Bug Reports": 2,
+        "Billing & Payments": 1
+    }
+
+
 # ============================================================================
 # Helper Function Tests
 # ============================================================================
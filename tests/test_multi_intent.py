@@ -5,7 +5,7 @@ Tests for multi-intent detection and smart routing.
 import pytest
 from src.core.rule_classifier import get_rule_classifier
 from src.core.router import get_router, RoutingDestination, RoutingAction
-from src.core.models import SupportCategory
+from src.core.models import SupportCategory, ClassificationResult, ClassificationMethod
 
 
 class TestMultiIntentDetection:
@@ -87,6 +87,37 @@ class TestMultiIntentDetection:
         assert len(result.category_scores) > 0
         assert "Billing & Payments" in result.category_scores
         assert "Account Management" in result.category_scores
+    
+    def test_reasoning_lists_patterns_in_query_order(self):
+        """Test that matched patterns are de-duplicated in query order."""
+        result = self.classifier.classify("Refund my payment, refund the invoice")
+        
+        assert result.reasoning.startswith("Matched 3 patterns: refund, payment, invoice")
+    
+    def test_analysis_memoized_on_cleaned_text(self):
+        """Test that queries with the same cleaned text reuse one analysis."""
+        from src.core.rule_classifier import RuleBasedClassifier
+        classifier = RuleBasedClassifier()
+        
+        first = classifier.classify("REFUND my invoice, I was charged twice")
+        second = classifier.classify("refund my invoice,   i was charged twice")
+        
+        assert classifier.analyze.cache_info().hits == 1
+        assert first.category_scores == second.category_scores
+        assert first.category_scores is not second.category_scores
+        assert first.reasoning == second.reasoning
+        assert second.routing_priority == "high"  # routing still runs per query
+    
+    def test_priority_flags_memoized_on_lowercased_query(self):
+        """Test that repeated queries reuse the priority keyword scan."""
+        from src.core.rule_classifier import RuleBasedClassifier
+        classifier = RuleBasedClassifier()
+        
+        first = classifier.classify("Security breach on my account")
+        second = classifier.classify("SECURITY BREACH on my account")
+        
+        assert classifier.priority_flags.cache_info().hits == 1
+        assert first.routing_priority == second.routing_priority == "critical"
 
 
 class TestRoutingDecisions:
@@ -166,6 +197,36 @@ class TestRoutingDecisions:
             routing = self.router.route(result)
             assert routing.special_instructions is not None
             assert len(routing.special_instructions) > 0
+    
+    @pytest.mark.parametrize("category", list(SupportCategory))
+    def test_route_by_category_table(self, category):
+        """Test that each category's prebuilt route uses its table entry."""
+        from src.core.router import _ROUTING_MAP
+        
+        result = ClassificationResult(
+            category=category,
+            confidence=0.9,
+            method=ClassificationMethod.RULE_BASED,
+            reasoning="Test",
+            response_time_ms=1.0,
+            routing_priority="high"
+        )
+        routing = self.router.route(result)
+        destination, wait_time, reason = _ROUTING_MAP[category]
+        
+        assert routing.destination == destination
+        assert routing.estimated_wait_time == wait_time
+        assert routing.reasoning == f"{reason}. Confidence: 90%"
+        assert routing.action == RoutingAction.QUEUE_PRIORITY
+    
+    def test_routing_decision_is_immutable(self):
+        """Test that routing decisions are frozen, slotted records."""
+        result = self.classifier.classify("I want a refund for my last invoice")
+        routing = self.router.route(result)
+        
+        assert not hasattr(routing, "__dict__")
+        with pytest.raises(AttributeError):
+            routing.priority = "low"
 
 
 class TestPriorityDetermination:
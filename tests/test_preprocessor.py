@@ -66,6 +66,41 @@ def test_preprocessor_emails():
     assert "contact me at" in result
 
 
+def test_preprocessor_url_with_query_and_escapes():
+    """Test that URL query strings and %XX escapes are removed whole."""
+    preprocessor = TextPreprocessor()
+    
+    result = preprocessor.preprocess("See https://example.com/a%20b?x=1&y=(2) now")
+    assert result == "see now"
+
+
+def test_preprocessor_long_run_without_email():
+    """Test that long address-like runs keep their text (no email match)."""
+    preprocessor = TextPreprocessor()
+    
+    result = preprocessor.preprocess("a." * 2000 + "@")
+    assert result == "a." * 2000
+
+
+def test_preprocessor_long_email_local_part():
+    """Test that local parts over 64 characters are still removed whole."""
+    preprocessor = TextPreprocessor()
+    
+    result = preprocessor.preprocess("contact " + "a" * 70 + "@example.com now")
+    assert result == "contact now"
+    
+    result = preprocessor.preprocess("contact " + "first.last." * 8 + "x@example.com now")
+    assert result == "contact now"
+
+
+def test_preprocessor_adjacent_emails():
+    """Test that an address right after another one is also removed."""
+    preprocessor = TextPreprocessor()
+    
+    result = preprocessor.preprocess("mail a@b.com.x@c.com today")
+    assert result == "mail today"
+
+
 def test_preprocessor_punctuation_normalization():
     """Test punctuation normalization."""
     preprocessor = TextPreprocessor()
@@ -119,6 +154,14 @@ def test_preprocessor_custom_config_keep_emojis():
     # Emojis might still be modified but not completely removed
 
 
+def test_preprocessing_config_is_frozen():
+    """Test that a config cannot change under a built preprocessor."""
+    config = PreprocessingConfig()
+    
+    with pytest.raises(AttributeError):
+        config.lowercase = False
+
+
 def test_preprocessor_remove_stopwords():
     """Test stop word removal when enabled."""
     config = PreprocessingConfig(remove_stopwords=True)
@@ -171,6 +214,15 @@ def test_extract_keywords_from_messy_input():
     assert "failed" in keywords
 
 
+def test_extract_keywords_keeps_inner_punctuation():
+    """Test that only leading/trailing punctuation is stripped."""
+    preprocessor = TextPreprocessor()
+    
+    keywords = preprocessor.extract_keywords("Charged $99.99 twice - e.g. re-billed, ok?!")
+    
+    assert keywords == ["charged", "$99.99", "twice", "e.g", "re-billed"]
+
+
 # ============================================================================
 # Phrase Extraction Tests
 # ============================================================================
@@ -256,6 +308,71 @@ def test_preprocessor_very_long_text():
     assert "me" in result
 
 
+@pytest.mark.parametrize("text, expected", [
+    ("my payment failed, please help.", True),
+    ("my payment failed!!", False),
+    ("My payment failed", False),
+    ("my  payment failed", False),
+    ("mail me at a@b.com", False),
+])
+def test_preprocessor_clean_text_fast_path(text, expected):
+    """Test that only text the pipeline would not change skips it."""
+    preprocessor = TextPreprocessor()
+    
+    assert preprocessor._is_clean(text) is expected
+    assert preprocessor.preprocess(text) == preprocessor._clean(preprocessor._remove_links(text)).strip()
+
+
+def test_preprocessor_memoizes_repeat_queries():
+    """Test that repeated text is served from the per-instance cache."""
+    preprocessor = TextPreprocessor()
+    
+    first = preprocessor.preprocess("My payment FAILED!!!")
+    second = preprocessor.preprocess("My payment FAILED!!!")
+    
+    assert first == second == "my payment failed!"
+    assert preprocessor.preprocess.cache_info().hits == 1
+    
+    preprocessor.preprocess.cache_clear()
+    assert preprocessor.preprocess.cache_info().currsize == 0
+
+
+# ============================================================================
+# Batch Preprocessing Tests
+# ============================================================================
+
+BATCH_TEXTS = [
+    "HELP!!! My payment FAILED 😭",
+    "!!!Really??? see https://example.com/help",
+    "",
+    "   ",
+    "Email me at user@example.com...",
+    "The app\tcrashes on my phone",
+    "null\x00byte text",
+    "ok",
+]
+
+
+@pytest.mark.parametrize("config", [
+    PreprocessingConfig(),
+    PreprocessingConfig(remove_emojis=False, lowercase=False),
+    PreprocessingConfig(normalize_whitespace=False, strip_whitespace=False),
+    PreprocessingConfig(remove_stopwords=True),
+])
+def test_preprocess_many_matches_preprocess(config):
+    """Test that batch output equals per-text preprocessing."""
+    preprocessor = TextPreprocessor(config)
+    
+    expected = [TextPreprocessor(config).preprocess(t) for t in BATCH_TEXTS]
+    
+    assert preprocessor.preprocess_many(BATCH_TEXTS) == expected
+
+
+def test_preprocess_many_empty_list():
+    """Test batch preprocessing of no texts."""
+    assert TextPreprocessor().preprocess_many([]) == []
+
+
 # ============================================================================
 # Singleton Tests
 # ============================================================================
@@ -279,6 +396,15 @@ def test_get_preprocessor_with_custom_config():
     assert default_prep is not custom_prep
 
 
+def test_get_preprocessor_shares_equal_custom_configs():
+    """Test that equal custom configs reuse one instance."""
+    first = get_preprocessor(PreprocessingConfig(remove_stopwords=True))
+    second = get_preprocessor(PreprocessingConfig(remove_stopwords=True))
+    
+    assert first is second
+    assert first is not get_preprocessor(PreprocessingConfig(lowercase=False))
+
+
 # ============================================================================
 # Real-World Examples
 # ============================================================================